@@ -16,6 +16,8 @@ from sqlalchemy import (
     TIMESTAMP,
     UniqueConstraint,
     create_engine,
+    event,
+    text,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
@@ -423,21 +425,88 @@ DB_PATH = Path(DB_DIR) / "tracktm.db"
 DATABASE_URL = f"sqlite+aiosqlite:///{DB_PATH}?check_same_thread=False&foreign_keys=ON"
 
 
+# Shared engine - created once per process so every session reuses pooled
+# connections instead of opening a fresh engine (and database handle) per call
+_ENGINE = create_engine(
+    DATABASE_URL.replace("+aiosqlite", ""),
+    echo=True,
+    # Sized to FastAPI's 40-thread worker pool so sync handlers don't queue
+    # on connection checkout; override per deployment through the environment
+    pool_size=int(os.getenv("TRACKTM_DB_POOL_SIZE", "20")),
+    max_overflow=int(os.getenv("TRACKTM_DB_MAX_OVERFLOW", "40")),
+    pool_timeout=int(os.getenv("TRACKTM_DB_POOL_TIMEOUT", "10")),
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
+# Sessions live for one request, so objects don't need to be expired (and
+# re-SELECTed on next access) after commit
+SessionLocal = sessionmaker(bind=_ENGINE, expire_on_commit=False)
+
+
+@event.listens_for(_ENGINE, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Per-connection SQLite tuning: WAL so a commit appends to the log
+    instead of rewriting pages through a rollback journal, and NORMAL sync
+    so the fsync happens at checkpoints rather than on every commit"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
 def get_engine():
     """Get SQLAlchemy engine"""
-    return create_engine(DATABASE_URL.replace("+aiosqlite", ""), echo=True)
+    return _ENGINE
+
+
+# Extra indexes - create_all() skips tables that already exist (job_materials
+# was created by an import script), so these are applied idempotently
+INDEXES = [
+    # Covers the job materials lookup: WHERE job_number = ? AND active = 1
+    """
+    CREATE INDEX IF NOT EXISTS idx_job_materials_job_active_cat
+    ON job_materials(job_number, active, category)
+    """,
+    # /api/materials orders the default catalog by a CASE rank over category,
+    # which no (category, name) index can serve - drop the one earlier
+    # versions created
+    "DROP INDEX IF EXISTS idx_materials_category_name",
+    # Child rows are read and deleted by daily_entry_id. daily_entries'
+    # (job_number, entry_date) and entry_line_items' (daily_entry_id, ...)
+    # are already covered by their unique constraints
+    """
+    CREATE INDEX IF NOT EXISTS idx_labor_entries_daily_entry
+    ON labor_entries(daily_entry_id)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_equipment_rental_items_daily_entry
+    ON equipment_rental_items(daily_entry_id)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_passthrough_expenses_daily_entry
+    ON passthrough_expenses(daily_entry_id)
+    """,
+]
+
+
+def create_indexes(engine):
+    """Create any missing indexes"""
+    with engine.begin() as conn:
+        for ddl in INDEXES:
+            conn.execute(text(ddl))
 
 
 def init_db():
     """Initialize database (create all tables)"""
     engine = get_engine()
     Base.metadata.create_all(engine)
+    create_indexes(engine)
     print("Database initialized successfully!")
     return engine
 
 
 def get_session():
     """Get database session"""
-    engine = get_engine()
-    SessionLocal = sessionmaker(bind=engine)
     return SessionLocal()
@@ -3,6 +3,7 @@ Invoice Generator - T&M Invoice PDF
 Aggregates multiple daily entries into a formal invoice
 """
 
+from reportlab import rl_config
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.lib.units import inch
@@ -12,13 +13,175 @@ from reportlab.platypus import (
     TableStyle,
     Paragraph,
     Spacer,
-    Image,
+    PageBreak,
+    Flowable,
 )
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_RIGHT, TA_LEFT, TA_CENTER
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import copy
+from functools import lru_cache
+from operator import itemgetter
 from io import BytesIO
+import logging
 import os
+import shutil
+import struct
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows - the in-process lock still applies
+    fcntl = None
+
+from report_logo import load_logo
+
+# Skip ReportLab's attribute validation outside debugging (TSI_DEBUG=1 keeps it)
+if not os.environ.get("TSI_DEBUG"):
+    rl_config.shapeChecking = 0
+
+logger = logging.getLogger(__name__)
+
+
+def _write_pdf(f, buffer):
+    """Write a PDF buffer or open file to f without a full bytes copy"""
+    if isinstance(buffer, BytesIO):
+        # getbuffer() is a view over the BytesIO's own memory; the with
+        # block releases it so the buffer can be resized again afterwards
+        with buffer.getbuffer() as view:
+            f.write(view)
+    else:
+        shutil.copyfileobj(buffer, f)
+
+
+# Single-invoice backups are written off the request path. One worker keeps
+# the writes in submission order; pending writes finish at interpreter exit.
+_backup_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="invoice-backup"
+)
+
+
+def _write_backup_file(filepath, pdf_bytes):
+    """Write one invoice backup file (runs on the backup thread)"""
+    try:
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        with open(filepath, "wb") as f:
+            f.write(pdf_bytes)
+
+        logger.info("Invoice saved: %s", filepath)
+    except Exception as e:
+        logger.warning("Could not save invoice backup: %s", e)
+
+
+@lru_cache(maxsize=2048)
+def _cell_paragraph(text, style_name):
+    """
+    Shared Paragraph for a table cell, interned on (text, style name)
+
+    Repeated descriptions across rows and invoices reuse one parsed
+    flowable. Place a copy() of it in the table, like the class-level
+    paragraphs on TSIInvoiceGenerator.
+    """
+    return Paragraph(text, TSIInvoiceGenerator._STYLES[style_name])
+
+
+class _PageMarker(Flowable):
+    """Zero-size flowable that records the page it lands on"""
+
+    page = None
+
+    def wrap(self, availWidth, availHeight):
+        return 0, 0
+
+    def draw(self):
+        self.page = self.canv.getPageNumber()
+
+
+class AggregatedBackupStore:
+    """
+    Append-only daily bundle of invoice PDF backups
+
+    Each record is <4-byte length><16-byte invoice number><pdf bytes>, all in
+    one invoices/YYYY-MM-DD.pdfbundle file instead of one file per invoice.
+    A tab-separated .idx sidecar maps invoice number -> offset, length.
+    """
+
+    HEADER = struct.Struct(">I16s")
+
+    # Serialises appends from threads in this process; flock on the bundle
+    # does the same across worker processes
+    _lock = threading.Lock()
+
+    def __init__(self, directory="invoices", day=None):
+        self.directory = directory
+        # A fixed day pins the store to that bundle (e.g. to read an older
+        # one); otherwise every call uses the current day's file
+        self.day = day
+
+    @property
+    def path(self):
+        """Bundle file for the store's day"""
+        day = self.day or datetime.now().strftime("%Y-%m-%d")
+        return os.path.join(self.directory, f"{day}.pdfbundle")
+
+    @staticmethod
+    def _index_key(invoice_number):
+        """Invoice number as written in the .idx file, with tabs, newlines
+        and backslashes escaped so they can't break the line format"""
+        return str(invoice_number).encode("unicode_escape").decode("ascii")
+
+    def append(self, invoice_number, pdf_bytes):
+        """Append one PDF to the bundle"""
+        self.append_many([(invoice_number, pdf_bytes)])
+
+    def append_many(self, records):
+        """Append (invoice_number, pdf_bytes) records with one open per file"""
+        path = self.path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._lock, open(path, "ab") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            # Offsets are only stable while the lock is held, so take them
+            # from the real end of file and write the index before releasing
+            f.seek(0, os.SEEK_END)
+            offset = f.tell()
+            index_lines = []
+            for invoice_number, pdf_bytes in records:
+                key = str(invoice_number)
+                f.write(self.HEADER.pack(len(pdf_bytes), key.encode()[:16]))
+                f.write(pdf_bytes)
+                index_lines.append(
+                    f"{self._index_key(key)}\t{offset + self.HEADER.size}"
+                    f"\t{len(pdf_bytes)}\n"
+                )
+                offset += self.HEADER.size + len(pdf_bytes)
+            f.flush()
+
+            with open(path + ".idx", "a") as index:
+                index.writelines(index_lines)
+
+    def read(self, invoice_number):
+        """Return the most recent PDF bytes stored for an invoice, or None"""
+        path = self.path
+        key = self._index_key(invoice_number)
+        location = None
+        try:
+            with open(path + ".idx") as f:
+                for line in f:
+                    number, offset, length = line.rstrip("\n").split("\t")
+                    if number == key:
+                        location = int(offset), int(length)
+        except FileNotFoundError:
+            return None
+
+        if location is None:
+            return None
+
+        offset, length = location
+        with open(path, "rb") as f:
+            f.seek(offset)
+            return f.read(length)
 
 
 class TSIInvoiceGenerator:
@@ -30,80 +193,316 @@ class TSIInvoiceGenerator:
     GRAY_DARK = colors.HexColor("#1f2937")
     GRAY_LIGHT = colors.HexColor("#f3f4f6")
 
-    def __init__(self, logo_path=None):
-        self.width, self.height = letter
-        self.styles = getSampleStyleSheet()
-        self.logo_path = logo_path or "logo.png"
-        self._setup_custom_styles()
-
-    def _setup_custom_styles(self):
-        """Setup invoice-specific styles"""
-        self.styles.add(
-            ParagraphStyle(
-                name="InvoiceTitle",
-                parent=self.styles["Normal"],
-                fontSize=24,
-                textColor=self.TSI_DARK_BROWN,
-                alignment=TA_CENTER,
-                fontName="Helvetica-Bold",
-                spaceAfter=20,
-            )
+    # Stylesheet shared by every instance - getSampleStyleSheet() and the
+    # custom styles are built once when the class is created, not per invoice
+    _STYLES = getSampleStyleSheet()
+    _STYLES.add(
+        ParagraphStyle(
+            name="InvoiceTitle",
+            parent=_STYLES["Normal"],
+            fontSize=24,
+            textColor=TSI_DARK_BROWN,
+            alignment=TA_CENTER,
+            fontName="Helvetica-Bold",
+            spaceAfter=20,
         )
-
-        self.styles.add(
-            ParagraphStyle(
-                name="SectionLabel",
-                parent=self.styles["Normal"],
-                fontSize=10,
-                textColor=colors.black,
-                fontName="Helvetica-Bold",
-            )
+    )
+
+    _STYLES.add(
+        ParagraphStyle(
+            name="SectionLabel",
+            parent=_STYLES["Normal"],
+            fontSize=10,
+            textColor=colors.black,
+            fontName="Helvetica-Bold",
         )
-
-        self.styles.add(
-            ParagraphStyle(
-                name="TableHeader",
-                parent=self.styles["Normal"],
-                fontSize=9,
-                textColor=colors.black,
-                fontName="Helvetica-Bold",
-                alignment=TA_CENTER,
-            )
+    )
+
+    _STYLES.add(
+        ParagraphStyle(
+            name="CellText",
+            parent=_STYLES["Normal"],
+            fontSize=9,
+            textColor=colors.black,
         )
-
-        self.styles.add(
-            ParagraphStyle(
-                name="CellText",
-                parent=self.styles["Normal"],
-                fontSize=9,
-                textColor=colors.black,
-            )
+    )
+
+    _STYLES.add(
+        ParagraphStyle(
+            name="SmallText",
+            parent=_STYLES["Normal"],
+            fontSize=8,
+            textColor=GRAY_DARK,
         )
+    )
+
+    # Title and section heading paragraphs are identical on every invoice,
+    # so their markup is parsed once per process. ReportLab sets .canv on a
+    # flowable while it lays it out, so each invoice places a copy() of these
+    # rather than the shared instance - concurrent builds would clobber it
+    _INVOICE_TITLE = Paragraph("T&M INVOICE", _STYLES["InvoiceTitle"])
+    _REMIT_TO_HEADER = Paragraph("<b>Remit To:</b>", _STYLES["SectionLabel"])
+    _BILL_TO_HEADER = Paragraph("<b>Bill To:</b>", _STYLES["SectionLabel"])
+    _SHIP_TO_HEADER = Paragraph("<b>Ship To:</b>", _STYLES["SectionLabel"])
+
+    # Fixed Remit To address lines
+    _REMIT_TO_LINES = [
+        Paragraph("<b>Tri-State Painting, LLC (TSI)</b>", _STYLES["SmallText"]),
+        Paragraph("P.O. Box 1240", _STYLES["SmallText"]),
+        Paragraph("612 West Main Street", _STYLES["SmallText"]),
+        Paragraph("Tilton, NH 03276-1240", _STYLES["SmallText"]),
+    ]
+
+    # Invoice metadata labels, keyed by label text
+    _LABEL_PARAS = {
+        "Invoice Date:": Paragraph("<b>Invoice Date:</b>", _STYLES["SmallText"]),
+        "Invoice #:": Paragraph("<b>Invoice #:</b>", _STYLES["SmallText"]),
+        "Due Date:": Paragraph("<b>Due Date:</b>", _STYLES["SmallText"]),
+        "Job Number:": Paragraph("<b>Job Number:</b>", _STYLES["SmallText"]),
+        "Period:": Paragraph("<b>Period:</b>", _STYLES["SmallText"]),
+        "Terms:": Paragraph("<b>Terms:</b>", _STYLES["SmallText"]),
+        "Subtotal": Paragraph("<b>Subtotal</b>", _STYLES["SectionLabel"]),
+        "Invoice Total": Paragraph("<b>Invoice Total</b>", _STYLES["SectionLabel"]),
+    }
+
+    # Table styles don't vary between invoices, so they are built once
+    _HEADER_STYLE = TableStyle(
+        [
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ("ALIGN", (0, 0), (0, 0), "LEFT"),
+            ("ALIGN", (1, 0), (1, 0), "RIGHT"),
+        ]
+    )
+
+    _REMIT_TO_STYLE = TableStyle(
+        [
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("LEFTPADDING", (0, 0), (-1, -1), 0),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+            ("TOPPADDING", (0, 0), (-1, -1), 2),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+        ]
+    )
+
+    _METADATA_STYLE = TableStyle(
+        [
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("LEFTPADDING", (0, 0), (-1, -1), 5),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 5),
+            ("TOPPADDING", (0, 0), (-1, -1), 2),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+            ("BACKGROUND", (0, 0), (0, -1), GRAY_LIGHT),
+        ]
+    )
 
-        self.styles.add(
-            ParagraphStyle(
-                name="SmallText",
-                parent=self.styles["Normal"],
-                fontSize=8,
-                textColor=self.GRAY_DARK,
-            )
-        )
+    _METADATA_LAYOUT_STYLE = TableStyle(
+        [
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("LEFTPADDING", (0, 0), (-1, -1), 0),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+        ]
+    )
+
+    _BILL_TO_STYLE = TableStyle(
+        [
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("LEFTPADDING", (0, 0), (-1, -1), 5),
+            ("TOPPADDING", (0, 0), (-1, -1), 3),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+        ]
+    )
+
+    _SHIP_TO_STYLE = TableStyle(
+        [
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("LEFTPADDING", (0, 0), (-1, -1), 5),
+            ("TOPPADDING", (0, 0), (-1, -1), 3),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+        ]
+    )
+
+    _BILLING_LAYOUT_STYLE = TableStyle(
+        [
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+            ("BACKGROUND", (0, 0), (0, 0), GRAY_LIGHT),
+            ("BACKGROUND", (1, 0), (1, 0), GRAY_LIGHT),
+        ]
+    )
+
+    _LINE_ITEMS_STYLE = TableStyle(
+        [
+            # Header styling
+            ("BACKGROUND", (0, 0), (-1, 0), GRAY_LIGHT),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.black),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, 0), 9),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
+            ("TOPPADDING", (0, 0), (-1, 0), 8),
+            ("GRID", (0, 0), (-1, 0), 1, colors.black),
+            # Data rows
+            ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+            ("FONTSIZE", (0, 1), (-1, -1), 9),
+            ("TOPPADDING", (0, 1), (-1, -1), 6),
+            ("BOTTOMPADDING", (0, 1), (-1, -1), 6),
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+            # Alignment
+            ("ALIGN", (0, 0), (0, -1), "CENTER"),  # Unit No
+            ("ALIGN", (1, 0), (1, -1), "LEFT"),  # Description
+            ("ALIGN", (2, 0), (2, -1), "CENTER"),  # Quantity
+            ("ALIGN", (3, 0), (3, -1), "RIGHT"),  # Unit Price
+            ("ALIGN", (4, 0), (4, -1), "CENTER"),  # Unit
+            ("ALIGN", (5, 0), (5, -1), "RIGHT"),  # Amount
+            ("ALIGN", (0, 0), (-1, 0), "CENTER"),  # Header row
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ]
+    )
+
+    _TOTALS_STYLE = TableStyle(
+        [
+            ("ALIGN", (0, 0), (0, -1), "RIGHT"),
+            ("ALIGN", (1, 0), (1, -1), "RIGHT"),
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+            ("BACKGROUND", (0, 0), (-1, 0), GRAY_LIGHT),
+            ("BACKGROUND", (0, 1), (-1, 1), GRAY_LIGHT),
+            ("TOPPADDING", (0, 0), (-1, -1), 6),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+            ("LEFTPADDING", (0, 0), (-1, -1), 10),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 10),
+            ("FONTNAME", (1, 0), (1, -1), "Helvetica-Bold"),
+            ("FONTSIZE", (1, 0), (1, -1), 10),
+        ]
+    )
+
+    # Line item fields read per row, with the defaults used when one is missing
+    _LINE_ITEM_DEFAULTS = {
+        "description": "",
+        "quantity": 1,
+        "unit_price": 0.0,
+        "unit": "Ea",
+        "amount": 0.0,
+    }
+    _LINE_ITEM_FIELDS = itemgetter(*_LINE_ITEM_DEFAULTS)
+
+    def __init__(self, logo_path=None, backup_store=None):
+        self.width, self.height = letter
+        self.styles = self._STYLES
+        self.logo_path = logo_path or "logo.png"
+        self._logo_image = load_logo(self.logo_path, 1.8 * inch, 0.95 * inch)
+        # Optional AggregatedBackupStore - backups go into its daily bundle
+        # instead of one PDF file per invoice
+        self.backup_store = backup_store
 
-    def generate_invoice(self, invoice_data, line_items, save_backup=True):
+    def generate_invoice(self, invoice_data, line_items, output=None, save_backup=True):
         """
         Generate invoice PDF
 
         Args:
             invoice_data: Dict with invoice metadata (invoice_number, dates, client info, etc.)
             line_items: List of aggregated line items for the invoice
-            save_backup: If True, saves PDF backup
+            output: Optional file path or writable file-like object; the PDF
+                is written straight to it instead of an in-memory buffer
+            save_backup: If True, saves PDF backup (an open file-like output
+                is left to the caller and not backed up)
 
         Returns:
-            BytesIO buffer containing PDF
+            BytesIO buffer containing PDF, or output when one was given
         """
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
+        if isinstance(output, (str, os.PathLike)):
+            return self.generate_invoice_to_path(
+                output, invoice_data, line_items, save_backup=save_backup
+            )
+        if output is not None:
+            return self.generate_invoice_to_stream(output, invoice_data, line_items)
+
+        buffer = self.generate_invoice_to_stream(BytesIO(), invoice_data, line_items)
+
+        # Take the bytes once; the backup and the returned buffer share them
+        pdf_bytes = buffer.getvalue()
+        if save_backup:
+            self._save_backup_pdf(pdf_bytes, invoice_data)
+
+        return BytesIO(pdf_bytes)
+
+    def generate_invoice_to_path(
+        self, path, invoice_data, line_items, save_backup=True
+    ):
+        """
+        Generate invoice PDF straight into a file, with no in-memory copy
+
+        Args:
+            path: Destination file path
+            invoice_data: Dict with invoice metadata
+            line_items: List of aggregated line items for the invoice
+            save_backup: If True, also saves PDF backup from the written file
+
+        Returns:
+            path
+        """
+        with open(path, "wb") as f:
+            self.generate_invoice_to_stream(f, invoice_data, line_items)
+
+        if save_backup:
+            with open(path, "rb") as f:
+                self._save_backup_pdf(f, invoice_data)
+
+        return path
+
+    def generate_invoice_to_stream(self, stream, invoice_data, line_items):
+        """
+        Build the invoice PDF into a writable file-like object
+
+        Args:
+            stream: Writable binary file-like object
+            invoice_data: Dict with invoice metadata
+            line_items: List of aggregated line items for the invoice
+
+        Returns:
+            stream
+        """
+        doc = self._doc_template(stream)
+        doc.build(self._invoice_story(invoice_data, line_items))
+        return stream
+
+    def generate_invoices_bulk(self, invoices, stream=None):
+        """
+        Build several invoices into one multi-page PDF with a single doc.build
+
+        Args:
+            invoices: Iterable of (invoice_data, line_items) pairs
+            stream: Optional writable file-like object (default: new BytesIO)
+
+        Returns:
+            (stream, page_ranges) - page_ranges holds one 1-based inclusive
+            (first_page, last_page) tuple per invoice, in order
+        """
+        stream = BytesIO() if stream is None else stream
+        doc = self._doc_template(stream)
+
+        story = []
+        markers = []
+        for invoice_data, line_items in invoices:
+            if markers:
+                story.append(PageBreak())
+            marker = _PageMarker()
+            markers.append(marker)
+            story.append(marker)
+            story.extend(self._invoice_story(invoice_data, line_items))
+
+        doc.build(story)
+
+        starts = [marker.page for marker in markers]
+        ends = [start - 1 for start in starts[1:]] + [doc.page]
+        if isinstance(stream, BytesIO):
+            stream.seek(0)
+        return stream, list(zip(starts, ends))
+
+    def _doc_template(self, stream):
+        """Letter page template with the invoice margins"""
+        return SimpleDocTemplate(
+            stream,
             pagesize=letter,
             rightMargin=0.5 * inch,
             leftMargin=0.5 * inch,
@@ -111,6 +510,8 @@ class TSIInvoiceGenerator:
             bottomMargin=0.5 * inch,
         )
 
+    def _invoice_story(self, invoice_data, line_items):
+        """Flowables for one invoice"""
         story = []
 
         # Header with logo and title
@@ -125,173 +526,136 @@ class TSIInvoiceGenerator:
         story.extend(self._create_billing_section(invoice_data))
         story.append(Spacer(1, 0.15 * inch))
 
-        # Line items table
-        story.append(self._create_line_items_table(line_items))
+        # Line items table (subtotal is summed while the rows are built)
+        line_items_table, subtotal = self._create_line_items_table(line_items)
+        story.append(line_items_table)
         story.append(Spacer(1, 0.1 * inch))
 
         # Totals
-        story.append(self._create_totals_section(line_items))
+        story.append(self._create_totals_section(subtotal))
+
+        return story
+
+    @classmethod
+    def generate_many(
+        cls,
+        invoices,
+        logo_path=None,
+        parallel=True,
+        save_backup=True,
+        backup_store=None,
+    ):
+        """
+        Generate several invoice PDFs in one call
 
-        # Build PDF
-        doc.build(story)
-        buffer.seek(0)
+        Args:
+            invoices: Iterable of (invoice_data, line_items) pairs
+            logo_path: Path to logo file
+            parallel: If True, build the PDFs across a process pool
+            save_backup: If True, saves a PDF backup of each invoice
+            backup_store: Optional AggregatedBackupStore for the backups
 
-        if save_backup:
-            self._save_backup_pdf(buffer, invoice_data)
-            buffer.seek(0)
+        Returns:
+            List of BytesIO buffers, in the same order as invoices
+        """
+        invoices = list(invoices)
+        generator = cls(logo_path=logo_path, backup_store=backup_store)
+
+        if parallel and len(invoices) > 1:
+            # ReportLab layout is CPU-bound, so use processes rather than
+            # threads; workers return raw bytes and backups are written below
+            workers = min(os.cpu_count() or 1, len(invoices))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_render_worker,
+                initargs=(generator.logo_path,),
+            ) as pool:
+                pdfs = list(
+                    pool.map(
+                        _render_invoice,
+                        (data for data, _ in invoices),
+                        (items for _, items in invoices),
+                        chunksize=max(1, len(invoices) // (workers * 4)),
+                    )
+                )
+            buffers = [BytesIO(pdf) for pdf in pdfs]
+        else:
+            buffers = [
+                generator.generate_invoice(data, items, save_backup=False)
+                for data, items in invoices
+            ]
 
-        return buffer
+        # Backups are written together once every PDF is built
+        if save_backup:
+            generator._save_backup_pdfs(buffers, (data for data, _ in invoices))
+        return buffers
 
     def _create_header(self):
         """Create header with logo and title"""
         elements = []
 
         # Logo and Title side by side
-        logo_element = None
-        if os.path.exists(self.logo_path):
-            try:
-                logo = Image(
-                    self.logo_path,
-                    width=1.8 * inch,
-                    height=0.95 * inch,
-                    kind="proportional",
-                )
-                logo_element = logo
-            except:
-                pass
-
-        if logo_element:
+        if self._logo_image is not None:
             header_data = [
                 [
-                    logo_element,
-                    Paragraph("T&M INVOICE", self.styles["InvoiceTitle"]),
+                    copy(self._logo_image),
+                    copy(self._INVOICE_TITLE),
                 ]
             ]
             header_table = Table(header_data, colWidths=[2 * inch, 5.5 * inch])
-            header_table.setStyle(
-                TableStyle(
-                    [
-                        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                        ("ALIGN", (0, 0), (0, 0), "LEFT"),
-                        ("ALIGN", (1, 0), (1, 0), "RIGHT"),
-                    ]
-                )
-            )
+            header_table.setStyle(self._HEADER_STYLE)
             elements.append(header_table)
         else:
-            elements.append(Paragraph("T&M INVOICE", self.styles["InvoiceTitle"]))
+            elements.append(copy(self._INVOICE_TITLE))
 
         return elements
 
     def _create_invoice_metadata(self, invoice_data):
         """Create Remit To section and invoice metadata"""
         elements = []
+        g = invoice_data.get
+        small = self.styles["SmallText"]
 
         # Create two-column layout: Remit To | Invoice Info
         remit_to_data = [
-            [Paragraph("<b>Remit To:</b>", self.styles["SectionLabel"])],
-            [
-                Paragraph(
-                    "<b>Tri-State Painting, LLC (TSI)</b>", self.styles["SmallText"]
-                )
-            ],
-            [Paragraph("P.O. Box 1240", self.styles["SmallText"])],
-            [Paragraph("612 West Main Street", self.styles["SmallText"])],
-            [Paragraph("Tilton, NH 03276-1240", self.styles["SmallText"])],
-            [
-                Paragraph(
-                    f"Phone {invoice_data.get('company_phone', '(603) 286-7657')}",
-                    self.styles["SmallText"],
-                )
-            ],
-            [
-                Paragraph(
-                    f"Fax {invoice_data.get('company_fax', '(603) 286-3807')}",
-                    self.styles["SmallText"],
-                )
-            ],
+            [copy(self._REMIT_TO_HEADER)],
+            *([copy(line)] for line in self._REMIT_TO_LINES),
+            [Paragraph(f"Phone {g('company_phone', '(603) 286-7657')}", small)],
+            [Paragraph(f"Fax {g('company_fax', '(603) 286-3807')}", small)],
         ]
 
         remit_table = Table(remit_to_data, colWidths=[3.5 * inch])
-        remit_table.setStyle(
-            TableStyle(
-                [
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-                    ("TOPPADDING", (0, 0), (-1, -1), 2),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-                ]
-            )
-        )
+        remit_table.setStyle(self._REMIT_TO_STYLE)
 
         # Invoice metadata
-        invoice_date = invoice_data.get(
-            "invoice_date", datetime.now().strftime("%m/%d/%y")
-        )
-        due_date = invoice_data.get("due_date", "")
-
+        # Only read the clock when the caller didn't supply a date
+        try:
+            invoice_date = invoice_data["invoice_date"]
+        except KeyError:
+            invoice_date = datetime.now().strftime("%m/%d/%y")
+        invoice_number = str(g("invoice_number", "0"))
+        due_date = g("due_date", "")
+        purchase_order = g("purchase_order", "")
+        period = g("period", "")
+        terms = g("terms", "Net 30")
+
+        labels = self._LABEL_PARAS
         metadata_data = [
-            [
-                Paragraph("<b>Invoice Date:</b>", self.styles["SmallText"]),
-                Paragraph(invoice_date, self.styles["SmallText"]),
-            ],
-            [
-                Paragraph("<b>Invoice #:</b>", self.styles["SmallText"]),
-                Paragraph(
-                    str(invoice_data.get("invoice_number", "0")),
-                    self.styles["SmallText"],
-                ),
-            ],
-            [
-                Paragraph("<b>Due Date:</b>", self.styles["SmallText"]),
-                Paragraph(due_date, self.styles["SmallText"]),
-            ],
-            [
-                Paragraph("<b>Job Number:</b>", self.styles["SmallText"]),
-                Paragraph(
-                    invoice_data.get("purchase_order", ""), self.styles["SmallText"]
-                ),
-            ],
-            [
-                Paragraph("<b>Period:</b>", self.styles["SmallText"]),
-                Paragraph(invoice_data.get("period", ""), self.styles["SmallText"]),
-            ],
-            [
-                Paragraph("<b>Terms:</b>", self.styles["SmallText"]),
-                Paragraph(
-                    invoice_data.get("terms", "Net 30"), self.styles["SmallText"]
-                ),
-            ],
+            [copy(labels["Invoice Date:"]), Paragraph(invoice_date, small)],
+            [copy(labels["Invoice #:"]), Paragraph(invoice_number, small)],
+            [copy(labels["Due Date:"]), Paragraph(due_date, small)],
+            [copy(labels["Job Number:"]), Paragraph(purchase_order, small)],
+            [copy(labels["Period:"]), Paragraph(period, small)],
+            [copy(labels["Terms:"]), Paragraph(terms, small)],
         ]
 
         metadata_table = Table(metadata_data, colWidths=[1.3 * inch, 2.5 * inch])
-        metadata_table.setStyle(
-            TableStyle(
-                [
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 5),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 5),
-                    ("TOPPADDING", (0, 0), (-1, -1), 2),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
-                    ("BACKGROUND", (0, 0), (0, -1), self.GRAY_LIGHT),
-                ]
-            )
-        )
+        metadata_table.setStyle(self._METADATA_STYLE)
 
         # Combine both sections
         combined_data = [[remit_table, metadata_table]]
         combined_table = Table(combined_data, colWidths=[3.5 * inch, 4 * inch])
-        combined_table.setStyle(
-            TableStyle(
-                [
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-                ]
-            )
-        )
+        combined_table.setStyle(self._METADATA_LAYOUT_STYLE)
 
         elements.append(combined_table)
         return elements
@@ -299,130 +663,97 @@ class TSIInvoiceGenerator:
     def _create_billing_section(self, invoice_data):
         """Create Bill To and Ship To section"""
         elements = []
+        g = invoice_data.get
+        small = self.styles["SmallText"]
 
         # Bill To
         bill_to_data = [
-            [Paragraph("<b>Bill To:</b>", self.styles["SectionLabel"])],
-            [Paragraph(invoice_data.get("bill_to_name", ""), self.styles["SmallText"])],
-            [
-                Paragraph(
-                    invoice_data.get("bill_to_address_line1", ""),
-                    self.styles["SmallText"],
-                )
-            ],
-            [
-                Paragraph(
-                    invoice_data.get("bill_to_address_line2", ""),
-                    self.styles["SmallText"],
-                )
-            ],
+            [copy(self._BILL_TO_HEADER)],
+            [Paragraph(g("bill_to_name", ""), small)],
+            [Paragraph(g("bill_to_address_line1", ""), small)],
+            [Paragraph(g("bill_to_address_line2", ""), small)],
         ]
 
         bill_to_table = Table(bill_to_data, colWidths=[3.5 * inch])
-        bill_to_table.setStyle(
-            TableStyle(
-                [
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 5),
-                    ("TOPPADDING", (0, 0), (-1, -1), 3),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-                ]
-            )
-        )
+        bill_to_table.setStyle(self._BILL_TO_STYLE)
 
         # Ship To
-        ship_to_lines = [Paragraph("<b>Ship To:</b>", self.styles["SectionLabel"])]
+        ship_to_lines = [copy(self._SHIP_TO_HEADER)]
 
         # Add location on separate line
-        if invoice_data.get("ship_to_location"):
-            ship_to_lines.append(
-                Paragraph(
-                    invoice_data.get("ship_to_location", ""), self.styles["SmallText"]
-                )
-            )
+        ship_to_location = g("ship_to_location")
+        if ship_to_location:
+            ship_to_lines.append(Paragraph(ship_to_location, small))
 
-        if invoice_data.get("job_name"):
-            ship_to_lines.append(
-                Paragraph(invoice_data.get("job_name", ""), self.styles["SmallText"])
-            )
+        job_name = g("job_name")
+        if job_name:
+            ship_to_lines.append(Paragraph(job_name, small))
 
-        if invoice_data.get("contract_number"):
-            ship_to_lines.append(
-                Paragraph(
-                    invoice_data.get("contract_number", ""), self.styles["SmallText"]
-                )
-            )
+        contract_number = g("contract_number")
+        if contract_number:
+            ship_to_lines.append(Paragraph(contract_number, small))
 
         ship_to_data = [[line] for line in ship_to_lines]
 
         ship_to_table = Table(ship_to_data, colWidths=[4 * inch])
-        ship_to_table.setStyle(
-            TableStyle(
-                [
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 5),
-                    ("TOPPADDING", (0, 0), (-1, -1), 3),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-                ]
-            )
-        )
+        ship_to_table.setStyle(self._SHIP_TO_STYLE)
 
         # Combine both sections with border
         combined_data = [[bill_to_table, ship_to_table]]
         combined_table = Table(combined_data, colWidths=[3.5 * inch, 4 * inch])
-        combined_table.setStyle(
-            TableStyle(
-                [
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
-                    ("BACKGROUND", (0, 0), (0, 0), self.GRAY_LIGHT),
-                    ("BACKGROUND", (1, 0), (1, 0), self.GRAY_LIGHT),
-                ]
-            )
-        )
+        combined_table.setStyle(self._BILLING_LAYOUT_STYLE)
 
         elements.append(combined_table)
         return elements
 
     def _create_line_items_table(self, line_items):
-        """Create the main line items table"""
+        """Create the main line items table
 
-        # Header row
+        Returns:
+            (table, subtotal) - the subtotal is summed from the fields read
+            for the rows so the totals section doesn't walk line_items again
+        """
+        # Header row - bold/centered by the TableStyle; "Unit No." is split
+        # by hand since plain strings don't wrap in the narrow first column
         table_data = [
-            [
-                Paragraph("<b>Unit No.</b>", self.styles["TableHeader"]),
-                Paragraph("<b>Description</b>", self.styles["TableHeader"]),
-                Paragraph("<b>Quantity</b>", self.styles["TableHeader"]),
-                Paragraph("<b>Unit Price</b>", self.styles["TableHeader"]),
-                Paragraph("<b>Unit</b>", self.styles["TableHeader"]),
-                Paragraph("<b>Amount</b>", self.styles["TableHeader"]),
-            ]
+            ["Unit\nNo.", "Description", "Quantity", "Unit Price", "Unit", "Amount"]
         ]
 
-        # Add line items
-        for idx, item in enumerate(line_items, start=1):
-            unit_no = f"{float(idx):.1f}"
-            description = item.get("description", "")
-            quantity = item.get("quantity", 1)
-            unit_price = item.get("unit_price", 0.0)
-            unit = item.get("unit", "Ea")
-            amount = item.get("amount", 0.0)
-
-            # Format quantity
-            qty_str = (
-                f"{int(quantity)}" if quantity == int(quantity) else f"{quantity:.2f}"
-            )
+        # Bound str.format methods skip re-parsing an f-string per cell
+        fmt_money = "$ {:,.2f}".format
+        fmt_qty = "{:.2f}".format
 
-            table_data.append(
-                [
-                    Paragraph(unit_no, self.styles["CellText"]),
-                    Paragraph(description, self.styles["CellText"]),
-                    Paragraph(qty_str, self.styles["CellText"]),
-                    Paragraph(f"$ {unit_price:,.2f}", self.styles["CellText"]),
-                    Paragraph(unit, self.styles["CellText"]),
-                    Paragraph(f"$ {amount:,.2f}", self.styles["CellText"]),
-                ]
+        # (description, quantity, unit_price, unit, amount) per item
+        get_fields = self._LINE_ITEM_FIELDS
+        try:
+            fields = list(map(get_fields, line_items))
+        except KeyError:
+            # Fill in defaults without touching the caller's dicts
+            defaults = self._LINE_ITEM_DEFAULTS
+            fields = [get_fields({**defaults, **item}) for item in line_items]
+
+        subtotal = sum((amount for *_, amount in fields), 0.0)
+
+        # Plain strings pick up font/alignment from the TableStyle below;
+        # only the description needs a Paragraph so long text can wrap
+        rows = [
+            [
+                f"{idx}.0",
+                copy(_cell_paragraph(description, "CellText")),
+                (
+                    str(whole)
+                    if quantity == (whole := int(quantity))
+                    else fmt_qty(quantity)
+                ),
+                fmt_money(unit_price),
+                unit,
+                fmt_money(amount),
+            ]
+            for idx, (description, quantity, unit_price, unit, amount) in enumerate(
+                fields, start=1
             )
+        ]
+        table_data.extend(rows)
 
         # Column widths - match Bill To/Ship To width (7.5" total)
         col_widths = [
@@ -435,96 +766,103 @@ class TSIInvoiceGenerator:
         ]
 
         table = Table(table_data, colWidths=col_widths, repeatRows=1)
-        table.setStyle(
-            TableStyle(
-                [
-                    # Header styling
-                    ("BACKGROUND", (0, 0), (-1, 0), self.GRAY_LIGHT),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.black),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, 0), 9),
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-                    ("TOPPADDING", (0, 0), (-1, 0), 8),
-                    ("GRID", (0, 0), (-1, 0), 1, colors.black),
-                    # Data rows
-                    ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-                    ("FONTSIZE", (0, 1), (-1, -1), 9),
-                    ("TOPPADDING", (0, 1), (-1, -1), 6),
-                    ("BOTTOMPADDING", (0, 1), (-1, -1), 6),
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
-                    # Alignment
-                    ("ALIGN", (0, 0), (0, -1), "CENTER"),  # Unit No
-                    ("ALIGN", (1, 0), (1, -1), "LEFT"),  # Description
-                    ("ALIGN", (2, 0), (2, -1), "CENTER"),  # Quantity
-                    ("ALIGN", (3, 0), (3, -1), "RIGHT"),  # Unit Price
-                    ("ALIGN", (4, 0), (4, -1), "CENTER"),  # Unit
-                    ("ALIGN", (5, 0), (5, -1), "RIGHT"),  # Amount
-                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ]
-            )
-        )
+        table.setStyle(self._LINE_ITEMS_STYLE)
 
-        return table
+        return table, subtotal
 
-    def _create_totals_section(self, line_items):
+    def _create_totals_section(self, subtotal):
         """Create subtotal and total section"""
 
-        # Calculate totals
-        subtotal = sum(item.get("amount", 0.0) for item in line_items)
-
+        subtotal_str = f"$ {subtotal:,.2f}"
         totals_data = [
-            [
-                Paragraph("<b>Subtotal</b>", self.styles["SectionLabel"]),
-                f"$ {subtotal:,.2f}",
-            ],
-            [
-                Paragraph("<b>Invoice Total</b>", self.styles["SectionLabel"]),
-                f"$ {subtotal:,.2f}",
-            ],
+            [copy(self._LABEL_PARAS["Subtotal"]), subtotal_str],
+            [copy(self._LABEL_PARAS["Invoice Total"]), subtotal_str],
         ]
 
         totals_table = Table(totals_data, colWidths=[6.5 * inch, 1.0 * inch])
-        totals_table.setStyle(
-            TableStyle(
-                [
-                    ("ALIGN", (0, 0), (0, -1), "RIGHT"),
-                    ("ALIGN", (1, 0), (1, -1), "RIGHT"),
-                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
-                    ("BACKGROUND", (0, 0), (-1, 0), self.GRAY_LIGHT),
-                    ("BACKGROUND", (0, 1), (-1, 1), self.GRAY_LIGHT),
-                    ("TOPPADDING", (0, 0), (-1, -1), 6),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 10),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 10),
-                    ("FONTNAME", (1, 0), (1, -1), "Helvetica-Bold"),
-                    ("FONTSIZE", (1, 0), (1, -1), 10),
-                ]
-            )
-        )
+        totals_table.setStyle(self._TOTALS_STYLE)
 
         return totals_table
 
-    def _save_backup_pdf(self, buffer, invoice_data):
-        """Save a backup copy of the invoice"""
+    BACKUP_DIR = "invoices"
+
+    def _backup_path(self, invoice_data):
+        """Backup file path for an invoice"""
+        g = invoice_data.get
+        invoice_number = g("invoice_number", "0")
+        job_number = g("job_number", "unknown")
+        filename = f"Invoice_{invoice_number}_{job_number}.pdf"
+        return os.path.join(self.BACKUP_DIR, filename)
+
+    def _save_backup_pdfs(self, buffers, invoice_datas):
+        """Save backup copies of a batch of invoices in one pass"""
+        if self.backup_store is not None:
+            try:
+                self.backup_store.append_many(
+                    (data.get("invoice_number", "0"), buffer.getvalue())
+                    for buffer, data in zip(buffers, invoice_datas)
+                )
+                logger.info("Invoices saved: %s", self.backup_store.path)
+            except Exception as e:
+                logger.warning("Could not save invoice backup: %s", e)
+            return
+
         try:
-            reports_dir = "invoices"
-            os.makedirs(reports_dir, exist_ok=True)
+            os.makedirs(self.BACKUP_DIR, exist_ok=True)
+        except Exception as e:
+            logger.warning("Could not save invoice backup: %s", e)
+            return
+
+        for buffer, invoice_data in zip(buffers, invoice_datas):
+            try:
+                filepath = self._backup_path(invoice_data)
+                with open(filepath, "wb") as f:
+                    _write_pdf(f, buffer)
+
+                logger.info("Invoice saved: %s", filepath)
+            except Exception as e:
+                logger.warning("Could not save invoice backup: %s", e)
+
+    def _save_backup_pdf(self, pdf, invoice_data):
+        """Save a backup copy of the invoice from PDF bytes or a file at offset 0"""
+        if isinstance(pdf, BytesIO):
+            pdf = pdf.getvalue()
+
+        if self.backup_store is not None:
+            try:
+                self.backup_store.append(
+                    invoice_data.get("invoice_number", "0"),
+                    pdf if isinstance(pdf, bytes) else pdf.read(),
+                )
+                logger.info("Invoice saved: %s", self.backup_store.path)
+            except Exception as e:
+                logger.warning("Could not save invoice backup: %s", e)
+            return
 
-            invoice_number = invoice_data.get("invoice_number", "0")
-            job_number = invoice_data.get("job_number", "unknown")
-            filename = f"Invoice_{invoice_number}_{job_number}.pdf"
-            filepath = os.path.join(reports_dir, filename)
+        filepath = self._backup_path(invoice_data)
+        if isinstance(pdf, bytes):
+            # Bytes are immutable, so the worker can write them after we return
+            _backup_executor.submit(_write_backup_file, filepath, pdf)
+            return
 
+        try:
+            os.makedirs(self.BACKUP_DIR, exist_ok=True)
             with open(filepath, "wb") as f:
-                f.write(buffer.getvalue())
+                _write_pdf(f, pdf)
 
-            print(f"âœ“ Invoice saved: {filepath}")
+            logger.info("Invoice saved: %s", filepath)
         except Exception as e:
-            print(f"Warning: Could not save invoice backup: {e}")
+            logger.warning("Could not save invoice backup: %s", e)
 
 
-def generate_invoice_pdf(invoice_data, line_items, logo_path=None, save_backup=True):
+def generate_invoice_pdf(
+    invoice_data,
+    line_items,
+    logo_path=None,
+    save_backup=True,
+    output_path=None,
+    backup_store=None,
+):
     """
     Generate invoice PDF
 
@@ -533,9 +871,73 @@ def generate_invoice_pdf(invoice_data, line_items, logo_path=None, save_backup=T
         line_items: List of aggregated line items
         logo_path: Path to logo file
         save_backup: If True, saves PDF backup
+        output_path: If given, the PDF is written straight to this file
+            instead of being returned in a buffer
+        backup_store: Optional AggregatedBackupStore for the backup
 
     Returns:
-        BytesIO buffer containing PDF
+        BytesIO buffer containing PDF, or output_path when one was given
     """
-    generator = TSIInvoiceGenerator(logo_path=logo_path)
+    generator = TSIInvoiceGenerator(logo_path=logo_path, backup_store=backup_store)
+    if output_path is not None:
+        return generator.generate_invoice_to_path(
+            output_path, invoice_data, line_items, save_backup=save_backup
+        )
     return generator.generate_invoice(invoice_data, line_items, save_backup=save_backup)
+
+
+def generate_invoice_pdfs(
+    invoices, logo_path=None, parallel=True, save_backup=True, backup_store=None
+):
+    """
+    Generate several invoice PDFs
+
+    Args:
+        invoices: Iterable of (invoice_data, line_items) pairs
+        logo_path: Path to logo file
+        parallel: If True, build the PDFs across a process pool
+        save_backup: If True, saves a PDF backup of each invoice
+        backup_store: Optional AggregatedBackupStore for the backups
+
+    Returns:
+        List of BytesIO buffers containing PDFs
+    """
+    return TSIInvoiceGenerator.generate_many(
+        invoices,
+        logo_path=logo_path,
+        parallel=parallel,
+        save_backup=save_backup,
+        backup_store=backup_store,
+    )
+
+
+def generate_invoices_bulk(invoices, logo_path=None):
+    """
+    Generate several invoices as one multi-page PDF
+
+    Args:
+        invoices: Iterable of (invoice_data, line_items) pairs
+        logo_path: Path to logo file
+
+    Returns:
+        (BytesIO buffer containing PDF, list of (first_page, last_page) per invoice)
+    """
+    generator = TSIInvoiceGenerator(logo_path=logo_path)
+    return generator.generate_invoices_bulk(invoices)
+
+
+# Per-process generator for pool workers, set up by _init_render_worker
+_worker_generator = None
+
+
+def _init_render_worker(logo_path):
+    """Process-pool initializer: build one generator per worker, logo decoded"""
+    global _worker_generator
+    _worker_generator = TSIInvoiceGenerator(logo_path=logo_path)
+
+
+def _render_invoice(invoice_data, line_items):
+    """Process-pool worker: build one invoice and return its PDF bytes"""
+    return _worker_generator.generate_invoice(
+        invoice_data, line_items, save_backup=False
+    ).getvalue()
@@ -3,7 +3,9 @@ Job-Specific Invoice Defaults
 Stores default invoice information per job number to auto-populate the invoice form
 """
 
-JOB_INVOICE_DEFAULTS = {
+from types import MappingProxyType
+
+_JOB_INVOICE_DEFAULTS = {
     "2507": {
         "job_name": "PNSY DD #2 Stairwells T&M",
         "contract_number": "Contract #2083-S-018",
@@ -33,26 +35,33 @@ JOB_INVOICE_DEFAULTS = {
     },
 }
 
+# Read-only view for callers; add_job_defaults updates the backing dict
+JOB_INVOICE_DEFAULTS = MappingProxyType(_JOB_INVOICE_DEFAULTS)
+
+_EMPTY_DEFAULTS = MappingProxyType(
+    {
+        "job_name": "",
+        "contract_number": "",
+        "ship_to_location": "",
+        "bill_to_name": "",
+        "bill_to_address1": "",
+        "bill_to_address2": "",
+        "notes": "",
+    }
+)
+
 
 def get_job_defaults(job_number):
     """Get default invoice settings for a job number"""
-    return JOB_INVOICE_DEFAULTS.get(
-        str(job_number),
-        {
-            "job_name": f"Job {job_number}",
-            "contract_number": "",
-            "ship_to_location": "",
-            "bill_to_name": "",
-            "bill_to_address1": "",
-            "bill_to_address2": "",
-            "notes": "",
-        },
-    )
+    defaults = JOB_INVOICE_DEFAULTS.get(str(job_number))
+    if defaults is None:
+        defaults = {**_EMPTY_DEFAULTS, "job_name": f"Job {job_number}"}
+    return defaults
 
 
 def add_job_defaults(job_number, defaults):
     """Add or update defaults for a job"""
-    JOB_INVOICE_DEFAULTS[str(job_number)] = defaults
+    _JOB_INVOICE_DEFAULTS[str(job_number)] = defaults
 
 
 # For API integration
@@ -3,6 +3,8 @@ Labor Catalog - T&M Rates
 Based on 2022 T&M and Equipment Rates contract
 """
 
+from itertools import chain
+
 LABOR_CATALOG = {
     "LABOR": [
         {
@@ -39,18 +41,19 @@ LABOR_CATALOG = {
 # Night shift differential
 NIGHT_SHIFT_DIFFERENTIAL = 2.00  # Add $2/hr for night shift
 
+# Flattened roles with IDs, built once since the catalog is static
+_ALL_LABOR_ROLES = tuple(
+    {"id": role_id, **item}
+    for role_id, item in enumerate(chain.from_iterable(LABOR_CATALOG.values()), 1)
+)
+
 def get_all_labor_roles():
-    """Return flattened list with IDs"""
-    roles = []
-    role_id = 1
-    for category, catalog_items in LABOR_CATALOG.items():
-        for item in catalog_items:
-            roles.append({
-                "id": role_id,
-                **item
-            })
-            role_id += 1
-    return roles
+    """Return the flattened roles with IDs
+
+    The tuple and its dicts are shared by every caller - treat them as
+    read-only and copy a role before changing it.
+    """
+    return _ALL_LABOR_ROLES
 
 def get_labor_by_category(category):
     """Get labor roles for specific category"""
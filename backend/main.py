@@ -4,16 +4,34 @@ TrackTM Simplified API
 Single PDF output with markup logic
 """
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, FileResponse
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict, field_validator
 from typing import List, Optional
-from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from decimal import Decimal
+from datetime import date, datetime, timedelta
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from decimal import Decimal, InvalidOperation
+import hashlib
+import orjson
+import os
+import threading
+import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from sqlalchemy import text
+from sqlalchemy import (
+    Float,
+    bindparam,
+    case,
+    delete,
+    func,
+    insert,
+    select,
+    text,
+    type_coerce,
+)
 from union_report_generator import generate_all_union_reports
 
 from database import (
@@ -26,13 +44,15 @@ from database import (
     EntryLineItem,
     LaborEntry,
     EquipmentRentalEntry,
+    PassThroughExpense,
     Employee,
     init_db,
 )
 
 from simplified_report_generator import generate_daily_report_pdf
-from invoice_generator import generate_invoice_pdf
+from invoice_generator import AggregatedBackupStore, generate_invoice_pdf
 from con9_csv_generator import generate_con9_csv, format_con9_filename
+from job_invoice_defaults import get_job_defaults
 
 
 # Initialize database on startup
@@ -43,7 +63,11 @@ async def lifespan(app: FastAPI):
     yield
 
 
-app = FastAPI(title="TrackTM Simplified API", lifespan=lifespan)
+app = FastAPI(
+    title="TrackTM Simplified API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # CORS
 app.add_middleware(
@@ -53,6 +77,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 
 # ============================================
@@ -60,6 +85,17 @@ app.add_middleware(
 # ============================================
 
 
+def to_cents(value: Optional[Decimal]) -> Optional[Decimal]:
+    """Round to the 2 dp of the Numeric(10, 2) columns the value is saved in"""
+    if value is None:
+        return None
+    try:
+        return value.quantize(Decimal("0.01"))
+    except InvalidOperation:
+        # Too many digits to quantize; a ValueError makes this a 422
+        raise ValueError("value is too large")
+
+
 class MaterialResponse(BaseModel):
     id: int
     name: str
@@ -97,13 +133,19 @@ class EmployeeInput(BaseModel):
     first_name: str
     last_name: str
     union: str
-    regular_rate: float
-    overtime_rate: float
-    health_welfare: float
-    pension: float
+    regular_rate: Decimal
+    overtime_rate: Decimal
+    health_welfare: Decimal
+    pension: Decimal
     active: bool = True
     notes: Optional[str] = None
 
+    # Round here so the saved employee we echo back matches what a later
+    # read returns
+    _to_cents = field_validator(
+        "regular_rate", "overtime_rate", "health_welfare", "pension"
+    )(to_cents)
+
 
 class EquipmentRentalResponse(BaseModel):
     id: int
@@ -117,32 +159,47 @@ class EquipmentRentalResponse(BaseModel):
     active: bool
 
 
+# Entry item inputs are read-only once validated
 class LineItemInput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     material_id: int
-    quantity: float
-    unit_price: Optional[float] = None
+    quantity: Decimal  # parsed straight to Decimal, no float round-trip
+    unit_price: Optional[Decimal] = None
+
+    # Invoice totals are summed in SQL over the stored values, so store them
+    # at the 2 dp the entry and reports read back
+    _to_cents = field_validator("quantity", "unit_price")(to_cents)
 
 
 class LaborItemInput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     labor_role_id: int
     employee_id: Optional[int] = None  # Reference to employees table
     employee_name: Optional[str] = None  # Fallback for backward compatibility
-    regular_hours: float = 0
-    overtime_hours: float = 0
+    regular_hours: Decimal = Decimal(0)
+    overtime_hours: Decimal = Decimal(0)
     night_shift: bool = False
 
+    _to_cents = field_validator("regular_hours", "overtime_hours")(to_cents)
+
 
 class EquipmentRentalInput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     equipment_rental_id: int
-    quantity: float
+    quantity: Decimal
     rate_period: str = "daily"
-    unit_rate: Optional[float] = None
+    unit_rate: Optional[Decimal] = None
     equipment_name: Optional[str] = None  # For job-specific equipment
 
+    _to_cents = field_validator("quantity", "unit_rate")(to_cents)
+
 
 class DailyEntryInput(BaseModel):
     job_number: str
-    entry_date: str
+    entry_date: date
     line_items: List[LineItemInput]
     labor_items: Optional[List[LaborItemInput]] = []
     equipment_items: Optional[List[EquipmentRentalInput]] = []
@@ -181,6 +238,18 @@ class InvoiceRequest(BaseModel):
     aggregation_method: Optional[str] = "category"  # Added - frontend sends this
 
 
+# Everything DailyEntry.to_dict() reads, loaded with the entry instead of
+# lazily per child row
+ENTRY_DICT_LOAD = (
+    selectinload(DailyEntry.line_items).joinedload(EntryLineItem.material),
+    selectinload(DailyEntry.labor_entries).options(
+        joinedload(LaborEntry.labor_role), joinedload(LaborEntry.employee)
+    ),
+    selectinload(DailyEntry.equipment_rental_items),
+    selectinload(DailyEntry.passthrough_expenses),
+)
+
+
 # ============================================
 # DATABASE DEPENDENCY
 # ============================================
@@ -200,46 +269,46 @@ def get_db():
 
 
 @app.get("/")
-def root():
+async def root():
     """Serve the main application HTML"""
     return FileResponse("index.html")
 
 
 @app.get("/test")
-def test_page():
+async def test_page():
     """Serve the invoice module test page"""
     return FileResponse("test_invoice_module.html")
 
 
 @app.get("/debug")
-def debug_page():
+async def debug_page():
     """Serve the invoice debug page"""
     return FileResponse("invoice_debug.html")
 
 
 # Serve static files directly
 @app.get("/app.js")
-def serve_app_js():
+async def serve_app_js():
     return FileResponse("app.js", media_type="application/javascript")
 
 
 @app.get("/invoice.js")
-def serve_invoice_js():
+async def serve_invoice_js():
     return FileResponse("invoice.js", media_type="application/javascript")
 
 
 @app.get("/styles.css")
-def serve_styles_css():
+async def serve_styles_css():
     return FileResponse("styles.css", media_type="text/css")
 
 
 @app.get("/logo.png")
-def serve_logo():
+async def serve_logo():
     return FileResponse("logo.png", media_type="image/png")
 
 
 @app.get("/api/")
-def api_root():
+async def api_root():
     return {
         "app": "TrackTM - Simplified",
         "version": "1.0.0",
@@ -247,46 +316,149 @@ def api_root():
     }
 
 
-@app.get("/api/materials", response_model=List[MaterialResponse])
-def get_materials(job_number: Optional[str] = None, db: Session = Depends(get_db)):
+CATEGORY_ORDER = ["EQUIPMENT", "MATERIALS", "PPE", "CONSUMABLES", "FUEL", "LODGING"]
+_CATEGORY_RANK = {cat: i for i, cat in enumerate(CATEGORY_ORDER)}
+
+
+def category_order(category_column):
+    """ORDER BY expression ranking categories by CATEGORY_ORDER (unknown last)"""
+    return case(_CATEGORY_RANK, value=category_column, else_=999)
+
+
+class TTLCache:
+    """Small in-process cache for reference data; entries expire after ttl seconds
+
+    Sync routes run on FastAPI's threadpool, so every access holds a lock.
+    """
+
+    def __init__(self, ttl, maxsize=256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            hit = self._data.get(key)
+        if hit is not None and hit[0] > time.monotonic():
+            return hit[1]
+        return None
+
+    def set(self, key, value):
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                # Drop the oldest entry
+                self._data.popitem(last=False)
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+# Materials and labor roles are only changed by import scripts, so a few
+# minutes of staleness is fine; restart the app to pick up edits sooner
+_materials_cache = TTLCache(ttl=300)
+_labor_roles_cache = TTLCache(ttl=300)
+_equipment_rentals_cache = TTLCache(ttl=300)
+
+
+def tagged_json(payload):
+    """(JSON body, ETag) for a payload, built once so cache hits reuse both
+
+    The tag is weak: GZipMiddleware may send the same entity compressed or
+    not, which are different bytes.
+    """
+    body = orjson.dumps(payload)
+    return body, f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(if_none_match, etag):
+    """Weak comparison of an If-None-Match header against our ETag"""
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(",")
+    )
+
+
+def etag_response(request: Request, tagged, max_age: int = 60):
+    """JSON response for a tagged_json() pair; 304 with no body if the client's
+    copy matches"""
+    body, etag = tagged
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={max_age}, must-revalidate",
+    }
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@app.get("/api/materials", responses={200: {"model": List[MaterialResponse]}})
+def get_materials(
+    request: Request, job_number: Optional[str] = None, db: Session = Depends(get_db)
+):
     """Get all materials in category order - job-specific if available, otherwise default"""
-    CATEGORY_ORDER = ["EQUIPMENT", "MATERIALS", "PPE", "CONSUMABLES", "FUEL", "LODGING"]
+    cache_key = job_number or ""
+    tagged = _materials_cache.get(cache_key)
+    if tagged is None:
+        # Rows are built in MaterialResponse's shape already, so they are
+        # dumped straight to JSON without a validation pass
+        tagged = tagged_json(_load_materials(job_number, db))
+        _materials_cache.set(cache_key, tagged)
+    return etag_response(request, tagged)
+
+
+def _query_materials(db, model, *criteria):
+    """MaterialResponse-shaped dicts for model rows, in category/name order"""
+    rows = (
+        db.query(model.id, model.name, model.category, model.unit, model.unit_price)
+        .filter(*criteria)
+        .order_by(category_order(model.category), model.name)
+    )
+    return [
+        {
+            "id": row.id,
+            "name": row.name,
+            "category": row.category,
+            "unit": row.unit,
+            "unit_price": float(row.unit_price),
+        }
+        for row in rows
+    ]
 
+
+def _load_materials(job_number, db):
+    """Materials for a job (or the default catalog) in category/name order"""
     if job_number:
         # Try to get job-specific materials first
-        job_materials = (
-            db.query(JobMaterial)
-            .filter(JobMaterial.job_number == job_number, JobMaterial.active == True)
-            .all()
+        materials = _query_materials(
+            db,
+            JobMaterial,
+            JobMaterial.job_number == job_number,
+            JobMaterial.active == True,
         )
 
-        if job_materials:
-            # Use job-specific materials
-            materials = [mat.to_dict() for mat in job_materials]
+        if materials:
             print(
                 f"✓ Loaded {len(materials)} job-specific materials for job {job_number}"
             )
-        else:
-            # Fall back to default catalog
-            all_materials = db.query(Material).all()
-            materials = [mat.to_dict() for mat in all_materials]
-            print(
-                f"✓ Using default catalog ({len(materials)} materials) for job {job_number}"
-            )
-    else:
-        # Default catalog
-        all_materials = db.query(Material).all()
-        materials = [mat.to_dict() for mat in all_materials]
+            return materials
 
-    def sort_key(mat):
-        try:
-            cat_index = CATEGORY_ORDER.index(mat["category"])
-        except ValueError:
-            cat_index = 999
-        return (cat_index, mat["name"])
+        # Fall back to default catalog
+        materials = _query_materials(db, Material)
+        print(
+            f"✓ Using default catalog ({len(materials)} materials) for job {job_number}"
+        )
+        return materials
 
-    materials = sorted(materials, key=sort_key)
-    return materials
+    # Default catalog
+    return _query_materials(db, Material)
 
 
 @app.get("/api/job-equipment/{job_number}")
@@ -307,11 +479,21 @@ def get_job_equipment(job_number: str, db: Session = Depends(get_db)):
     return [eq.to_dict() for eq in equipment]
 
 
-@app.get("/api/labor-roles", response_model=List[LaborRoleResponse])
-def get_labor_roles(db: Session = Depends(get_db)):
+@app.get("/api/labor-roles", responses={200: {"model": List[LaborRoleResponse]}})
+def get_labor_roles(request: Request, db: Session = Depends(get_db)):
     """Get all labor roles"""
-    roles = db.query(LaborRole).order_by(LaborRole.name).all()
-    return [role.to_dict() for role in roles]
+    tagged = _labor_roles_cache.get("all")
+    if tagged is None:
+        # to_dict() already matches LaborRoleResponse, so skip revalidating
+        # every role and cache the serialized list
+        tagged = tagged_json(
+            [
+                role.to_dict()
+                for role in db.query(LaborRole).order_by(LaborRole.name).all()
+            ]
+        )
+        _labor_roles_cache.set("all", tagged)
+    return etag_response(request, tagged)
 
 
 @app.get("/api/employees", response_model=List[EmployeeResponse])
@@ -328,12 +510,12 @@ def get_employees(active_only: bool = True, db: Session = Depends(get_db)):
 def create_employee(employee_input: EmployeeInput, db: Session = Depends(get_db)):
     """Create a new employee"""
     # Check if employee number already exists
-    existing = (
-        db.query(Employee)
-        .filter(Employee.employee_number == employee_input.employee_number)
-        .first()
+    existing_id = db.scalar(
+        select(Employee.id).where(
+            Employee.employee_number == employee_input.employee_number
+        )
     )
-    if existing:
+    if existing_id is not None:
         raise HTTPException(
             status_code=400,
             detail=f"Employee number '{employee_input.employee_number}' already exists",
@@ -344,16 +526,15 @@ def create_employee(employee_input: EmployeeInput, db: Session = Depends(get_db)
         first_name=employee_input.first_name,
         last_name=employee_input.last_name,
         union=employee_input.union,
-        regular_rate=Decimal(str(employee_input.regular_rate)),
-        overtime_rate=Decimal(str(employee_input.overtime_rate)),
-        health_welfare=Decimal(str(employee_input.health_welfare)),
-        pension=Decimal(str(employee_input.pension)),
+        regular_rate=employee_input.regular_rate,
+        overtime_rate=employee_input.overtime_rate,
+        health_welfare=employee_input.health_welfare,
+        pension=employee_input.pension,
         active=employee_input.active,
         notes=employee_input.notes,
     )
     db.add(employee)
     db.commit()
-    db.refresh(employee)
     return employee.to_dict()
 
 
@@ -362,18 +543,18 @@ def update_employee(
     employee_id: int, employee_input: EmployeeInput, db: Session = Depends(get_db)
 ):
     """Update an employee"""
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
+    employee = db.get(Employee, employee_id)
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
 
     # Check if employee number is being changed to one that already exists
     if employee_input.employee_number != employee.employee_number:
-        existing = (
-            db.query(Employee)
-            .filter(Employee.employee_number == employee_input.employee_number)
-            .first()
+        existing_id = db.scalar(
+            select(Employee.id).where(
+                Employee.employee_number == employee_input.employee_number
+            )
         )
-        if existing:
+        if existing_id is not None:
             raise HTTPException(
                 status_code=400,
                 detail=f"Employee number '{employee_input.employee_number}' already exists",
@@ -383,28 +564,30 @@ def update_employee(
     employee.first_name = employee_input.first_name
     employee.last_name = employee_input.last_name
     employee.union = employee_input.union
-    employee.regular_rate = Decimal(str(employee_input.regular_rate))
-    employee.overtime_rate = Decimal(str(employee_input.overtime_rate))
-    employee.health_welfare = Decimal(str(employee_input.health_welfare))
-    employee.pension = Decimal(str(employee_input.pension))
+    employee.regular_rate = employee_input.regular_rate
+    employee.overtime_rate = employee_input.overtime_rate
+    employee.health_welfare = employee_input.health_welfare
+    employee.pension = employee_input.pension
     employee.active = employee_input.active
     employee.notes = employee_input.notes
 
     db.commit()
-    db.refresh(employee)
     return employee.to_dict()
 
 
 @app.delete("/api/employees/{employee_id}")
 def delete_employee(employee_id: int, db: Session = Depends(get_db)):
     """Delete an employee (or mark as inactive if they have labor entries)"""
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
+    employee = db.get(Employee, employee_id)
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
 
     # Check if employee has any labor entries
     has_entries = (
-        db.query(LaborEntry).filter(LaborEntry.employee_id == employee_id).first()
+        db.scalar(
+            select(LaborEntry.id).where(LaborEntry.employee_id == employee_id).limit(1)
+        )
+        is not None
     )
 
     if has_entries:
@@ -423,22 +606,38 @@ def delete_employee(employee_id: int, db: Session = Depends(get_db)):
         return {"message": f"Employee '{name}' (#{number}) deleted successfully"}
 
 
-@app.get("/api/equipment-rentals", response_model=List[EquipmentRentalResponse])
+@app.get(
+    "/api/equipment-rentals",
+    responses={200: {"model": List[EquipmentRentalResponse]}},
+)
 def get_equipment_rentals(
+    request: Request,
     year: str = "2022",
     active: bool = True,
+    category: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
-    """Get all equipment rental rates"""
+    """Get all equipment rental rates, optionally for one category"""
+    cache_key = (year, active, category)
+    tagged = _equipment_rentals_cache.get(cache_key)
+    if tagged is None:
+        tagged = tagged_json(_load_equipment_rentals(year, active, category, db))
+        _equipment_rentals_cache.set(cache_key, tagged)
+    return etag_response(request, tagged)
+
+
+def _load_equipment_rentals(year, active, category, db):
+    """EquipmentRentalResponse-shaped dicts for one year's rental rates"""
     query = db.execute(
         text(
             """
         SELECT id, category, name, unit, daily_rate, weekly_rate, monthly_rate, year, active
         FROM equipment_rental_rates
         WHERE year = :year AND active = :active
+          AND (:category IS NULL OR category = :category)
     """
         ),
-        {"year": year, "active": 1 if active else 0},
+        {"year": year, "active": 1 if active else 0, "category": category},
     )
 
     rentals = []
@@ -460,51 +659,12 @@ def get_equipment_rentals(
     return rentals
 
 
-@app.get("/api/job-equipment/{job_number}")
-def get_job_equipment(job_number: str, db: Session = Depends(get_db)):
-    """Get job-specific equipment with hourly rates"""
-    try:
-        query = db.execute(
-            text(
-                """
-                SELECT id, name, hourly_rate, active
-                FROM job_equipment
-                WHERE job_number = :job_number AND active = 1
-                ORDER BY name
-                """
-            ),
-            {"job_number": job_number},
-        )
-
-        equipment = []
-        for row in query:
-            equipment.append(
-                {
-                    "id": row[0],
-                    "name": row[1],
-                    "hourly_rate": float(row[2]),
-                    "active": bool(row[3]),
-                }
-            )
-
-        if not equipment:
-            raise HTTPException(
-                status_code=404, detail=f"No equipment found for job {job_number}"
-            )
-
-        return equipment
-    except Exception as e:
-        print(f"Error loading job equipment: {e}")
-        raise HTTPException(
-            status_code=404, detail=f"No equipment configured for job {job_number}"
-        )
-
-
 @app.get("/api/entries/{job_number}/{entry_date}")
 def get_entry_by_date(job_number: str, entry_date: str, db: Session = Depends(get_db)):
     """Get a specific daily entry"""
     entry = (
         db.query(DailyEntry)
+        .options(*ENTRY_DICT_LOAD)
         .filter(
             DailyEntry.job_number == job_number, DailyEntry.entry_date == entry_date
         )
@@ -520,92 +680,119 @@ def get_entry_by_date(job_number: str, entry_date: str, db: Session = Depends(ge
 # In main.py, update the save function to look in the right place:
 
 
+# Position of each rate period's column in an equipment_rental_rates row
+# (name, category, unit, daily_rate, weekly_rate, monthly_rate); any other
+# period is billed at the daily rate
+DAILY_RATE_COLUMN = 3
+RATE_PERIOD_COLUMN = {"daily": DAILY_RATE_COLUMN, "weekly": 4, "monthly": 5}
+
+
 @app.post("/api/entries")
 def create_or_update_entry(entry_input: DailyEntryInput, db: Session = Depends(get_db)):
     """Create or update a daily entry"""
 
-    entry_date = datetime.strptime(entry_input.entry_date, "%Y-%m-%d").date()
+    entry_date = entry_input.entry_date
 
-    # Check if entry exists
-    existing_entry = (
-        db.query(DailyEntry)
-        .filter(
-            DailyEntry.job_number == entry_input.job_number,
-            DailyEntry.entry_date == entry_date,
+    # Create the entry or reuse the existing one in a single upsert, so two
+    # saves for the same job and date can't both try to insert it
+    entry_id = db.scalar(
+        sqlite_insert(DailyEntry)
+        .values(job_number=entry_input.job_number, entry_date=entry_date)
+        .on_conflict_do_update(
+            index_elements=[DailyEntry.job_number, DailyEntry.entry_date],
+            set_={"job_number": entry_input.job_number},
         )
-        .first()
+        .returning(DailyEntry.id)
     )
 
-    if existing_entry:
-        daily_entry = existing_entry
-        # Delete existing items
-        db.query(EntryLineItem).filter(
-            EntryLineItem.daily_entry_id == daily_entry.id
-        ).delete()
-        db.query(LaborEntry).filter(
-            LaborEntry.daily_entry_id == daily_entry.id
-        ).delete()
-        db.query(EquipmentRentalEntry).filter(
-            EquipmentRentalEntry.daily_entry_id == daily_entry.id
-        ).delete()
-    else:
-        daily_entry = DailyEntry(
-            job_number=entry_input.job_number, entry_date=entry_date
+    # Replace any existing items. None of them are loaded in this session,
+    # so skip the identity-map sync pass
+    for model in (EntryLineItem, LaborEntry, EquipmentRentalEntry):
+        db.execute(
+            delete(model).where(model.daily_entry_id == entry_id),
+            execution_options={"synchronize_session": False},
         )
-        db.add(daily_entry)
-        db.flush()
 
     # Add material line items
-    for line_item_input in entry_input.line_items:
-        if line_item_input.quantity > 0:
-            # ✅ Try job materials first, then fall back to regular materials
-            job_material = (
-                db.query(JobMaterial)
-                .filter(
-                    JobMaterial.id == line_item_input.material_id,
-                    JobMaterial.job_number == entry_input.job_number,
-                    JobMaterial.active == True,
-                )
-                .first()
+    # Resolve every referenced material up front: job materials first, then
+    # the general catalog for whatever is left
+    material_ids = {
+        li.material_id for li in entry_input.line_items if li.quantity > 0
+    }
+    job_material_prices = dict(
+        db.query(JobMaterial.id, JobMaterial.unit_price).filter(
+            JobMaterial.id.in_(material_ids),
+            JobMaterial.job_number == entry_input.job_number,
+            JobMaterial.active == True,
+        )
+    )
+    catalog_ids = material_ids - job_material_prices.keys()
+    material_prices = (
+        dict(
+            db.query(Material.id, Material.unit_price).filter(
+                Material.id.in_(catalog_ids)
             )
+        )
+        if catalog_ids
+        else {}
+    )
 
-            if job_material:
-                # Found in job materials
-                unit_price = (
-                    line_item_input.unit_price
-                    if line_item_input.unit_price is not None
-                    else job_material.unit_price
-                )
+    line_item_rows = []
+    for line_item_input in entry_input.line_items:
+        if line_item_input.quantity > 0:
+            material_id = line_item_input.material_id
+            if material_id in job_material_prices:
+                default_price = job_material_prices[material_id]
+            elif material_id in material_prices:
+                default_price = material_prices[material_id]
             else:
-                # Try regular materials
-                material = (
-                    db.query(Material)
-                    .filter(Material.id == line_item_input.material_id)
-                    .first()
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Material ID {material_id} not found in job materials or general catalog",
                 )
 
-                if not material:
-                    raise HTTPException(
-                        status_code=404,
-                        detail=f"Material ID {line_item_input.material_id} not found in job materials or general catalog",
-                    )
-
-                unit_price = (
-                    line_item_input.unit_price
-                    if line_item_input.unit_price is not None
-                    else material.unit_price
-                )
+            unit_price = (
+                line_item_input.unit_price
+                if line_item_input.unit_price is not None
+                else default_price
+            )
 
-            line_item = EntryLineItem(
-                daily_entry_id=daily_entry.id,
-                material_id=line_item_input.material_id,
-                quantity=Decimal(str(line_item_input.quantity)),
-                unit_price=Decimal(str(unit_price)),
+            line_item_rows.append(
+                {
+                    "daily_entry_id": entry_id,
+                    "material_id": material_id,
+                    "quantity": line_item_input.quantity,
+                    "unit_price": unit_price,
+                }
             )
-            db.add(line_item)
+
+    # One executemany INSERT instead of a unit-of-work flush per line item
+    if line_item_rows:
+        db.execute(insert(EntryLineItem), line_item_rows)
 
     # Add equipment rental items
     if entry_input.equipment_items:
+        # Look up every referenced rental rate in one query
+        rental_ids = {
+            item.equipment_rental_id
+            for item in entry_input.equipment_items
+            if item.quantity > 0 and item.equipment_rental_id != 0
+        }
+        rental_rates = {}
+        if rental_ids:
+            rows = db.execute(
+                text(
+                    """
+                    SELECT id, name, category, unit, daily_rate, weekly_rate, monthly_rate
+                    FROM equipment_rental_rates
+                    WHERE id IN :equipment_ids
+                """
+                ).bindparams(bindparam("equipment_ids", expanding=True)),
+                {"equipment_ids": list(rental_ids)},
+            )
+            rental_rates = {row[0]: row[1:] for row in rows}
+
+        equipment_rows = []
         for equip_item in entry_input.equipment_items:
             if equip_item.quantity > 0:
                 # Check if this is job-specific equipment (equipment_rental_id = 0)
@@ -613,28 +800,20 @@ def create_or_update_entry(entry_input: DailyEntryInput, db: Session = Depends(g
                 if equip_item.equipment_rental_id == 0:
                     # Job-specific equipment - use provided name and rate
                     equipment_name = equip_item.equipment_name or "Job Equipment"
-                    equipment_entry = EquipmentRentalEntry(
-                        daily_entry_id=daily_entry.id,
-                        equipment_rental_id=0,
-                        quantity=Decimal(str(equip_item.quantity)),
-                        unit_rate=Decimal(str(equip_item.unit_rate)),
-                        equipment_name=equipment_name,
-                        equipment_category="EQUIPMENT",
-                        unit="Hour",
+                    equipment_rows.append(
+                        {
+                            "daily_entry_id": entry_id,
+                            "equipment_rental_id": 0,
+                            "quantity": equip_item.quantity,
+                            "unit_rate": equip_item.unit_rate,
+                            "equipment_name": equipment_name,
+                            "equipment_category": "EQUIPMENT",
+                            "unit": "Hour",
+                        }
                     )
-                    db.add(equipment_entry)
                 else:
                     # Traditional equipment rental rates
-                    result = db.execute(
-                        text(
-                            """
-                            SELECT name, category, unit, daily_rate, weekly_rate, monthly_rate
-                            FROM equipment_rental_rates
-                            WHERE id = :equipment_id
-                        """
-                        ),
-                        {"equipment_id": equip_item.equipment_rental_id},
-                    ).fetchone()
+                    result = rental_rates.get(equip_item.equipment_rental_id)
 
                     if not result:
                         raise HTTPException(
@@ -646,12 +825,8 @@ def create_or_update_entry(entry_input: DailyEntryInput, db: Session = Depends(g
                     equipment_category = result[1]
                     unit = result[2]
 
-                    if equip_item.rate_period == "weekly":
-                        rate = result[4]
-                    elif equip_item.rate_period == "monthly":
-                        rate = result[5]
-                    else:
-                        rate = result[3]
+                    period = equip_item.rate_period
+                    rate = result[RATE_PERIOD_COLUMN.get(period, DAILY_RATE_COLUMN)]
 
                     if rate is None:
                         raise HTTPException(
@@ -659,58 +834,81 @@ def create_or_update_entry(entry_input: DailyEntryInput, db: Session = Depends(g
                             detail=f"No {equip_item.rate_period} rate available for {equipment_name}",
                         )
 
-                    equipment_entry = EquipmentRentalEntry(
-                        daily_entry_id=daily_entry.id,
-                        equipment_rental_id=equip_item.equipment_rental_id,
-                        quantity=Decimal(str(equip_item.quantity)),
-                        unit_rate=Decimal(str(rate)),
-                        equipment_name=equipment_name,
-                        equipment_category=equipment_category,
-                        unit=unit,
+                    equipment_rows.append(
+                        {
+                            "daily_entry_id": entry_id,
+                            "equipment_rental_id": equip_item.equipment_rental_id,
+                            "quantity": equip_item.quantity,
+                            "unit_rate": Decimal(str(rate)),
+                            "equipment_name": equipment_name,
+                            "equipment_category": equipment_category,
+                            "unit": unit,
+                        }
                     )
-                    db.add(equipment_entry)
+
+        if equipment_rows:
+            db.execute(insert(EquipmentRentalEntry), equipment_rows)
 
     # Add labor entries
     if entry_input.labor_items:
-        for labor_item in entry_input.labor_items:
-            if labor_item.regular_hours > 0 or labor_item.overtime_hours > 0:
-                labor_role = (
-                    db.query(LaborRole)
-                    .filter(LaborRole.id == labor_item.labor_role_id)
-                    .first()
+        labor_items = [
+            item
+            for item in entry_input.labor_items
+            if item.regular_hours > 0 or item.overtime_hours > 0
+        ]
+
+        # Check every referenced role and employee with one query per table
+        role_ids = {item.labor_role_id for item in labor_items}
+        known_role_ids = set(
+            db.scalars(select(LaborRole.id).where(LaborRole.id.in_(role_ids)))
+        )
+        employee_ids = {item.employee_id for item in labor_items if item.employee_id}
+        known_employee_ids = (
+            set(db.scalars(select(Employee.id).where(Employee.id.in_(employee_ids))))
+            if employee_ids
+            else set()
+        )
+
+        labor_entry_rows = []
+        for labor_item in labor_items:
+            if labor_item.labor_role_id not in known_role_ids:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Labor role ID {labor_item.labor_role_id} not found",
                 )
 
-                if not labor_role:
-                    raise HTTPException(
-                        status_code=404,
-                        detail=f"Labor role ID {labor_item.labor_role_id} not found",
-                    )
+            # Verify employee_id if provided
+            employee_id = labor_item.employee_id
+            if employee_id and employee_id not in known_employee_ids:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Employee ID {employee_id} not found",
+                )
 
-                # Verify employee_id if provided
-                employee_id = labor_item.employee_id
-                if employee_id:
-                    employee = (
-                        db.query(Employee).filter(Employee.id == employee_id).first()
-                    )
-                    if not employee:
-                        raise HTTPException(
-                            status_code=404,
-                            detail=f"Employee ID {employee_id} not found",
-                        )
+            labor_entry_rows.append(
+                {
+                    "daily_entry_id": entry_id,
+                    "labor_role_id": labor_item.labor_role_id,
+                    "employee_id": employee_id,
+                    "employee_name": labor_item.employee_name,
+                    "regular_hours": labor_item.regular_hours,
+                    "overtime_hours": labor_item.overtime_hours,
+                    "night_shift": labor_item.night_shift,
+                }
+            )
 
-                labor_entry = LaborEntry(
-                    daily_entry_id=daily_entry.id,
-                    labor_role_id=labor_item.labor_role_id,
-                    employee_id=employee_id,
-                    employee_name=labor_item.employee_name,
-                    regular_hours=Decimal(str(labor_item.regular_hours)),
-                    overtime_hours=Decimal(str(labor_item.overtime_hours)),
-                    night_shift=labor_item.night_shift,
-                )
-                db.add(labor_entry)
+        if labor_entry_rows:
+            db.execute(insert(LaborEntry), labor_entry_rows)
 
     db.commit()
-    db.refresh(daily_entry)
+
+    # Read the saved entry back with everything to_dict() needs
+    daily_entry = (
+        db.query(DailyEntry)
+        .options(*ENTRY_DICT_LOAD)
+        .filter(DailyEntry.id == entry_id)
+        .one()
+    )
 
     return {"message": "Entry saved successfully", "entry": daily_entry.to_dict()}
 
@@ -730,6 +928,7 @@ def generate_daily_report(request: ReportRequest, db: Session = Depends(get_db))
         # Get the specific entry
         entry = (
             db.query(DailyEntry)
+            .options(*ENTRY_DICT_LOAD)
             .filter(
                 DailyEntry.job_number == request.job_number,
                 DailyEntry.entry_date == entry_date,
@@ -766,8 +965,8 @@ def generate_daily_report(request: ReportRequest, db: Session = Depends(get_db))
         filename = f"TSI_Report_{request.job_number}_{entry_date}.pdf"
 
         # Return PDF
-        return StreamingResponse(
-            iter([pdf_buffer.getvalue()]),
+        return Response(
+            content=pdf_buffer.getvalue(),
             media_type="application/pdf",
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
@@ -796,6 +995,7 @@ def generate_union_reports(request: ReportRequest, db: Session = Depends(get_db)
         # Get the specific entry
         entry = (
             db.query(DailyEntry)
+            .options(*ENTRY_DICT_LOAD)
             .filter(
                 DailyEntry.job_number == request.job_number,
                 DailyEntry.entry_date == entry_date,
@@ -819,16 +1019,13 @@ def generate_union_reports(request: ReportRequest, db: Session = Depends(get_db)
         # Prepare entry data with employee objects
         entry_dict = entry.to_dict()
 
-        # Enhance labor entries with full employee objects
-        for labor in entry_dict["labor_entries"]:
-            if labor.get("employee_id"):
-                employee = (
-                    db.query(Employee)
-                    .filter(Employee.id == labor["employee_id"])
-                    .first()
-                )
-                if employee:
-                    labor["employee"] = employee.to_dict()
+        # Enhance labor entries with full employee objects, already loaded
+        # alongside the labor rows by ENTRY_DICT_LOAD
+        for labor, labor_entry in zip(
+            entry_dict["labor_entries"], entry.labor_entries
+        ):
+            if labor_entry.employee is not None:
+                labor["employee"] = labor_entry.employee.to_dict()
 
         # Generate all reports
         reports = generate_all_union_reports(
@@ -846,11 +1043,10 @@ def generate_union_reports(request: ReportRequest, db: Session = Depends(get_db)
                 )
                 zf.writestr(report_filename, pdf_buffer.getvalue())
 
-        zip_buffer.seek(0)
         filename = f"JFW_LABOR_REPORTS_{request.job_number}_{entry_date}.zip"
 
-        return StreamingResponse(
-            iter([zip_buffer.getvalue()]),
+        return Response(
+            content=zip_buffer.getvalue(),
             media_type="application/zip",
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
@@ -882,6 +1078,7 @@ def generate_con9_csv_export(request: ReportRequest, db: Session = Depends(get_d
         # Get the specific entry
         entry = (
             db.query(DailyEntry)
+            .options(*ENTRY_DICT_LOAD)
             .filter(
                 DailyEntry.job_number == request.job_number,
                 DailyEntry.entry_date == entry_date,
@@ -912,8 +1109,8 @@ def generate_con9_csv_export(request: ReportRequest, db: Session = Depends(get_d
         filename = format_con9_filename(request.job_number, entry_date)
 
         # Return CSV
-        return StreamingResponse(
-            iter([csv_buffer.getvalue()]),
+        return Response(
+            content=csv_buffer.getvalue(),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
@@ -931,14 +1128,19 @@ def generate_con9_csv_export(request: ReportRequest, db: Session = Depends(get_d
 
 
 @app.get("/api/job-invoice-defaults/{job_number}")
-def get_job_invoice_defaults(job_number: str):
+async def get_job_invoice_defaults(job_number: str):
     """Get default invoice settings for a job number"""
-    from job_invoice_defaults import get_job_defaults
-
     defaults = get_job_defaults(job_number)
     return {"defaults": defaults}
 
 
+# TRACKTM_INVOICE_BUNDLE=1 appends invoice backups to the daily
+# invoices/YYYY-MM-DD.pdfbundle instead of writing one PDF file per invoice
+_invoice_backup_store = (
+    AggregatedBackupStore() if os.getenv("TRACKTM_INVOICE_BUNDLE") else None
+)
+
+
 @app.post("/api/invoice/generate")
 def generate_invoice(request: InvoiceRequest, db: Session = Depends(get_db)):
     """Generate invoice PDF by aggregating multiple daily entries"""
@@ -948,17 +1150,14 @@ def generate_invoice(request: InvoiceRequest, db: Session = Depends(get_db)):
         start_date = request.start_date
         end_date = request.end_date
 
-        # Build query for date range
-        query = db.query(DailyEntry).filter(DailyEntry.job_number == job_number)
-
+        # Date range filter shared by the existence check and the totals
+        criteria = [DailyEntry.job_number == job_number]
         if start_date:
-            query = query.filter(DailyEntry.entry_date >= start_date)
+            criteria.append(DailyEntry.entry_date >= start_date)
         if end_date:
-            query = query.filter(DailyEntry.entry_date <= end_date)
+            criteria.append(DailyEntry.entry_date <= end_date)
 
-        entries = query.order_by(DailyEntry.entry_date).all()
-
-        if not entries:
+        if db.scalar(select(DailyEntry.id).where(*criteria).limit(1)) is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"No entries found for job {job_number}"
@@ -966,18 +1165,18 @@ def generate_invoice(request: InvoiceRequest, db: Session = Depends(get_db)):
             )
 
         # Aggregate entries - use category method (Materials, Labor, Equipment)
-        line_items = _aggregate_by_category(entries)
+        line_items = _aggregate_by_category(_category_totals(db, criteria))
 
         # Calculate period display
         period = ""
         if start_date and end_date:
-            start_obj = datetime.strptime(start_date, "%Y-%m-%d")
-            end_obj = datetime.strptime(end_date, "%Y-%m-%d")
+            start_obj = date.fromisoformat(start_date)
+            end_obj = date.fromisoformat(end_date)
             period = (
                 f"{start_obj.strftime('%m/%d/%y')} - {end_obj.strftime('%m/%d/%y')}"
             )
         elif start_date:
-            period = datetime.strptime(start_date, "%Y-%m-%d").strftime("%m/%d/%y")
+            period = date.fromisoformat(start_date).strftime("%m/%d/%y")
 
         # Calculate due date
         invoice_date = datetime.now()
@@ -1011,14 +1210,19 @@ def generate_invoice(request: InvoiceRequest, db: Session = Depends(get_db)):
         }
 
         # Generate PDF
-        pdf_buffer = generate_invoice_pdf(invoice_data, line_items, save_backup=True)
+        pdf_buffer = generate_invoice_pdf(
+            invoice_data,
+            line_items,
+            save_backup=True,
+            backup_store=_invoice_backup_store,
+        )
 
         # Generate filename
         filename = f"Invoice_{invoice_num}_{job_number}.pdf"
 
         # Return PDF
-        return StreamingResponse(
-            iter([pdf_buffer.getvalue()]),
+        return Response(
+            content=pdf_buffer.getvalue(),
             media_type="application/pdf",
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
@@ -1035,23 +1239,92 @@ def generate_invoice(request: InvoiceRequest, db: Session = Depends(get_db)):
         )
 
 
-def _aggregate_by_category(entries):
-    """Aggregate all items by category (Materials, Labor, Equipment)"""
+def _sum(amount):
+    """SUM(amount) as a float, 0.0 when there are no rows"""
+    return type_coerce(func.coalesce(func.sum(amount), 0.0), Float)
+
+
+def _is_dehumidifier_rental(name):
+    """SQL test matching the invoice's dehumidifier rental naming"""
+    name = func.lower(func.coalesce(name, ""))
+    return name.contains("dehumidifier") & name.contains("rental")
+
+
+def _category_totals(db, criteria):
+    """Invoice category totals for the entries matching criteria, summed in SQL
+
+    Each total is a scalar subquery of a single SELECT, so the reduction takes
+    one round trip.
+    """
+    # Materials (dehumidifier rentals are billed with equipment)
+    materials_base = (
+        select(_sum(EntryLineItem.quantity * EntryLineItem.unit_price))
+        .join(DailyEntry, EntryLineItem.daily_entry_id == DailyEntry.id)
+        .outerjoin(Material, EntryLineItem.material_id == Material.id)
+        .where(*criteria, ~_is_dehumidifier_rental(Material.name))
+    )
+
+    # Equipment, with dehumidifier rentals split out as a pass-through
+    equipment_amount = EquipmentRentalEntry.quantity * EquipmentRentalEntry.unit_rate
+    dehumidifier = _is_dehumidifier_rental(EquipmentRentalEntry.equipment_name)
+    equipment_base = (
+        select(_sum(case((dehumidifier, 0), else_=equipment_amount)))
+        .join(DailyEntry, EquipmentRentalEntry.daily_entry_id == DailyEntry.id)
+        .where(*criteria)
+    )
+    dehumidifier_total = (
+        select(_sum(case((dehumidifier, equipment_amount), else_=0)))
+        .join(DailyEntry, EquipmentRentalEntry.daily_entry_id == DailyEntry.id)
+        .where(*criteria)
+    )
+
+    # Labor at the role's rates plus the night shift differential
+    night = case((LaborEntry.night_shift == True, 2.0), else_=0.0)
+    labor_total = (
+        select(
+            _sum(
+                LaborEntry.regular_hours * (LaborRole.straight_rate + night)
+                + LaborEntry.overtime_hours * (LaborRole.overtime_rate + night)
+            )
+        )
+        .join(DailyEntry, LaborEntry.daily_entry_id == DailyEntry.id)
+        .join(LaborRole, LaborEntry.labor_role_id == LaborRole.id)
+        .where(*criteria)
+    )
+
+    passthrough_total = (
+        select(_sum(PassThroughExpense.amount))
+        .join(DailyEntry, PassThroughExpense.daily_entry_id == DailyEntry.id)
+        .where(*criteria)
+    )
+
+    totals = {
+        "materials_base": materials_base,
+        "equipment_base": equipment_base,
+        "dehumidifier_total": dehumidifier_total,
+        "labor_total": labor_total,
+        "passthrough_total": passthrough_total,
+    }
+    row = db.execute(
+        select(
+            *(
+                type_coerce(query.scalar_subquery(), Float)
+                for query in totals.values()
+            )
+        )
+    ).one()
+    return dict(zip(totals, row))
+
+
+def _aggregate_by_category(totals):
+    """Invoice line items (Materials, Labor, Equipment) from category totals"""
     line_items = []
 
-    # Aggregate materials
-    materials_base = 0.0
-
-    for entry in entries:
-        for item in entry.line_items:
-            # Skip dehumidifier rentals (handled separately)
-            if (
-                "dehumidifier" in item.material.name.lower()
-                and "rental" in item.material.name.lower()
-            ):
-                continue
-            else:
-                materials_base += item.total_amount
+    materials_base = totals["materials_base"]
+    equipment_base = totals["equipment_base"]
+    dehumidifier_total = totals["dehumidifier_total"]
+    labor_total = totals["labor_total"]
+    passthrough_total = totals["passthrough_total"]
 
     if materials_base > 0:
         # Apply markup: base + 10% OH + 10% profit
@@ -1070,21 +1343,6 @@ def _aggregate_by_category(entries):
             }
         )
 
-    # Aggregate equipment
-    equipment_base = 0.0
-    dehumidifier_total = 0.0
-
-    for entry in entries:
-        for item in entry.equipment_rental_items:
-            # Check for dehumidifier rental - separate line item, no markup
-            if (
-                "dehumidifier" in item.equipment_name.lower()
-                and "rental" in item.equipment_name.lower()
-            ):
-                dehumidifier_total += item.total_amount
-            else:
-                equipment_base += item.total_amount
-
     if equipment_base > 0:
         # Apply markup: base + 10% OH + 10% profit
         equipment_oh = equipment_base * 0.10
@@ -1115,12 +1373,7 @@ def _aggregate_by_category(entries):
             }
         )
 
-    # Aggregate labor (no markup)
-    labor_total = 0.0
-    for entry in entries:
-        for item in entry.labor_entries:
-            labor_total += item.total_amount
-
+    # Labor (no markup)
     if labor_total > 0:
         line_items.append(
             {
@@ -1133,12 +1386,7 @@ def _aggregate_by_category(entries):
             }
         )
 
-    # Aggregate pass-through expenses (no markup)
-    passthrough_total = 0.0
-    for entry in entries:
-        for item in entry.passthrough_expenses:
-            passthrough_total += item.amount
-
+    # Pass-through expenses (no markup)
     if passthrough_total > 0:
         line_items.append(
             {
@@ -1152,3 +1400,20 @@ def _aggregate_by_category(entries):
         )
 
     return line_items
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # Production entry point: one process per core. uvicorn[standard] ships
+    # uvloop and httptools, so ask for them explicitly rather than the
+    # asyncio/h11 fallbacks
+    uvicorn.run(
+        "main:app",
+        host=os.getenv("TRACKTM_HOST", "127.0.0.1"),
+        port=int(os.getenv("TRACKTM_PORT", "8000")),
+        workers=int(os.getenv("WEB_CONCURRENCY", 2 * (os.cpu_count() or 1) + 1)),
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+    )
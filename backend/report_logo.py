@@ -0,0 +1,39 @@
+"""
+Report Logo - decoded logo flowables shared by the PDF generators
+"""
+
+from reportlab.platypus import Image
+from functools import lru_cache
+from io import BytesIO
+import os
+
+
+@lru_cache(maxsize=8)
+def _decoded_logo(path, mtime, width, height):
+    """
+    Logo flowable with its PNG already decoded, built once per
+    (path, mtime, size) - a changed file gets a new key
+
+    Draw a copy() of it: copies share the decoded image data but keep their
+    own layout state (ReportLab sets .canv on a flowable while drawing it).
+    """
+    with open(path, "rb") as f:
+        logo = Image(
+            BytesIO(f.read()), width=width, height=height, kind="proportional"
+        )
+    # Decode up front so no PDF build pays for (or races on) the first decode
+    logo._img.getRGBData()
+    return logo
+
+
+def load_logo(path, width, height):
+    """Cached logo flowable for path at the given size; None if there is no logo"""
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return None
+
+    try:
+        return _decoded_logo(path, mtime, width, height)
+    except Exception:
+        return None
@@ -14,14 +14,16 @@ from reportlab.platypus import (
     TableStyle,
     Paragraph,
     Spacer,
-    Image,
 )
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_RIGHT, TA_LEFT
 from datetime import datetime
+from copy import copy
 from io import BytesIO
 import os
 
+from report_logo import load_logo
+
 
 class TSIReportGenerator:
     """Simplified TSI report generator with proper markup"""
@@ -32,65 +34,197 @@ class TSIReportGenerator:
     GRAY_DARK = colors.HexColor("#1f2937")
     GRAY_LIGHT = colors.HexColor("#f3f4f6")
 
-    def __init__(self, logo_path=None):
-        self.width, self.height = letter
-        self.styles = getSampleStyleSheet()
-        self.logo_path = logo_path or "logo.png"
-        self._setup_custom_styles()
-
-    def _setup_custom_styles(self):
-        """Setup TSI-branded styles"""
-        self.styles.add(
-            ParagraphStyle(
-                name="CompanyName",
-                parent=self.styles["Normal"],
-                fontSize=16,
-                textColor=self.TSI_BROWN,
-                fontName="Helvetica-Bold",
-                spaceAfter=2,
-            )
+    # Stylesheet shared by every instance - getSampleStyleSheet() and the
+    # custom styles are built once when the class is created, not per report
+    _STYLES = getSampleStyleSheet()
+    _STYLES.add(
+        ParagraphStyle(
+            name="CompanyName",
+            parent=_STYLES["Normal"],
+            fontSize=16,
+            textColor=TSI_BROWN,
+            fontName="Helvetica-Bold",
+            spaceAfter=2,
         )
+    )
 
-        self.styles.add(
-            ParagraphStyle(
-                name="ReportTitle",
-                parent=self.styles["Normal"],
-                fontSize=18,
-                textColor=self.TSI_BROWN,
-                alignment=TA_RIGHT,
-                fontName="Helvetica-Bold",
-            )
+    _STYLES.add(
+        ParagraphStyle(
+            name="ReportTitle",
+            parent=_STYLES["Normal"],
+            fontSize=18,
+            textColor=TSI_BROWN,
+            alignment=TA_RIGHT,
+            fontName="Helvetica-Bold",
         )
+    )
 
-        self.styles.add(
-            ParagraphStyle(
-                name="SectionHeader",
-                parent=self.styles["Normal"],
-                fontSize=11,
-                textColor=self.TSI_DARK_BROWN,
-                fontName="Helvetica-Bold",
-                spaceAfter=6,
-                spaceBefore=10,
-            )
+    _STYLES.add(
+        ParagraphStyle(
+            name="SectionHeader",
+            parent=_STYLES["Normal"],
+            fontSize=11,
+            textColor=TSI_DARK_BROWN,
+            fontName="Helvetica-Bold",
+            spaceAfter=6,
+            spaceBefore=10,
         )
+    )
 
-        self.styles.add(
-            ParagraphStyle(
-                name="SmallText",
-                parent=self.styles["Normal"],
-                fontSize=9,
-                textColor=self.GRAY_DARK,
-            )
+    _STYLES.add(
+        ParagraphStyle(
+            name="SmallText",
+            parent=_STYLES["Normal"],
+            fontSize=9,
+            textColor=GRAY_DARK,
         )
+    )
 
-        self.styles.add(
-            ParagraphStyle(
-                name="TableText",
-                parent=self.styles["Normal"],
-                fontSize=9,
-                textColor=self.GRAY_DARK,
-            )
+    _STYLES.add(
+        ParagraphStyle(
+            name="TableText",
+            parent=_STYLES["Normal"],
+            fontSize=9,
+            textColor=GRAY_DARK,
         )
+    )
+
+    # Title and section headings are the same on every report, so their
+    # markup is parsed once; each build places a copy() (see the invoice
+    # generator - a shared flowable can't be laid out by two builds at once)
+    _REPORT_TITLE = Paragraph("DAILY REPORT", _STYLES["ReportTitle"])
+    _MATERIALS_HEADING = Paragraph("MATERIALS", _STYLES["SectionHeader"])
+    _EQUIPMENT_HEADING = Paragraph("EQUIPMENT RENTALS", _STYLES["SectionHeader"])
+    _LABOR_HEADING = Paragraph("LABOR", _STYLES["SectionHeader"])
+
+    # Table styles don't vary between reports, so they are built once
+    _LINE_STYLE = TableStyle(
+        [
+            ("LINEBELOW", (0, 0), (-1, 0), 1.5, TSI_BROWN),
+        ]
+    )
+
+    _HEADER_STYLE_WITH_LOGO = TableStyle(
+        [
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ("ALIGN", (0, 0), (0, 0), "LEFT"),
+            ("ALIGN", (1, 0), (1, 0), "LEFT"),
+            ("ALIGN", (2, 0), (2, 0), "RIGHT"),
+        ]
+    )
+
+    _HEADER_STYLE_NO_LOGO = TableStyle(
+        [
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("ALIGN", (0, 0), (0, 0), "LEFT"),
+            ("ALIGN", (1, 0), (1, 0), "RIGHT"),
+        ]
+    )
+
+    _JOB_INFO_STYLE = TableStyle(
+        [
+            ("ALIGN", (0, 0), (0, -1), "LEFT"),
+            ("ALIGN", (1, 0), (1, -1), "LEFT"),
+            ("ALIGN", (2, 0), (2, -1), "LEFT"),
+            ("ALIGN", (3, 0), (3, -1), "LEFT"),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
+            ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+            ("FONTNAME", (2, 0), (2, -1), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, -1), 9),
+            ("TEXTCOLOR", (0, 0), (-1, -1), GRAY_DARK),
+        ]
+    )
+
+    # Shared by the materials and equipment tables (same column layout)
+    _ITEMS_STYLE = TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), GRAY_LIGHT),
+            ("TEXTCOLOR", (0, 0), (-1, 0), TSI_DARK_BROWN),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, 0), 9),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
+            ("TOPPADDING", (0, 0), (-1, 0), 8),
+            ("FONTNAME", (0, 1), (-1, -2), "Helvetica"),
+            ("FONTSIZE", (0, 1), (-1, -2), 9),
+            ("TEXTCOLOR", (0, 1), (-1, -1), GRAY_DARK),
+            ("TOPPADDING", (0, 1), (-1, -2), 6),
+            ("BOTTOMPADDING", (0, 1), (-1, -2), 6),
+            ("BACKGROUND", (0, -1), (-1, -1), GRAY_LIGHT),
+            ("FONTNAME", (0, -1), (-1, -1), "Helvetica-Bold"),
+            ("FONTSIZE", (0, -1), (-1, -1), 9),
+            ("ALIGN", (0, 0), (0, -1), "LEFT"),
+            ("ALIGN", (1, 0), (3, -1), "CENTER"),
+            ("ALIGN", (4, 0), (4, -1), "RIGHT"),
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ("LINEBELOW", (0, 0), (-1, 0), 1, TSI_BROWN),
+            ("LINEBELOW", (0, 1), (-1, -2), 0.5, colors.HexColor("#e5e7eb")),
+            ("LINEABOVE", (0, -1), (-1, -1), 1, TSI_BROWN),
+            ("BOX", (0, 0), (-1, -1), 1, TSI_BROWN),
+        ]
+    )
+
+    _LABOR_STYLE = TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), GRAY_LIGHT),
+            ("TEXTCOLOR", (0, 0), (-1, 0), TSI_DARK_BROWN),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, 0), 9),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
+            ("TOPPADDING", (0, 0), (-1, 0), 8),
+            ("FONTNAME", (0, 1), (-1, -2), "Helvetica"),
+            ("FONTSIZE", (0, 1), (-1, -2), 9),
+            ("TEXTCOLOR", (0, 1), (-1, -1), GRAY_DARK),
+            ("TOPPADDING", (0, 1), (-1, -2), 6),
+            ("BOTTOMPADDING", (0, 1), (-1, -2), 6),
+            ("BACKGROUND", (0, -1), (-1, -1), GRAY_LIGHT),
+            ("FONTNAME", (0, -1), (-1, -1), "Helvetica-Bold"),
+            ("FONTSIZE", (0, -1), (-1, -1), 9),
+            ("ALIGN", (0, 0), (1, -1), "LEFT"),
+            ("ALIGN", (2, 0), (4, -1), "CENTER"),
+            ("ALIGN", (5, 0), (5, -1), "RIGHT"),
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ("LINEBELOW", (0, 0), (-1, 0), 1, TSI_BROWN),
+            ("LINEBELOW", (0, 1), (-1, -2), 0.5, colors.HexColor("#e5e7eb")),
+            ("LINEABOVE", (0, -1), (-1, -1), 1, TSI_BROWN),
+            ("BOX", (0, 0), (-1, -1), 1, TSI_BROWN),
+        ]
+    )
+
+    _MARKUP_STYLE = TableStyle(
+        [
+            ("ALIGN", (0, 0), (0, -1), "RIGHT"),
+            ("ALIGN", (1, 0), (1, -1), "RIGHT"),
+            (
+                "FONTNAME",
+                (0, -1),
+                (-1, -1),
+                "Helvetica-Bold",
+            ),  # This makes the last row bold
+            ("FONTSIZE", (0, 0), (-1, -1), 8),
+            ("TOPPADDING", (0, 0), (-1, -1), 2),
+            ("LINEABOVE", (0, -1), (-1, -1), 1, TSI_BROWN),
+        ]
+    )
+
+    _TOTAL_STYLE = TableStyle(
+        [
+            ("ALIGN", (0, 0), (0, 0), "RIGHT"),
+            ("ALIGN", (1, 0), (1, 0), "RIGHT"),
+            ("FONTNAME", (0, 0), (-1, -1), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, -1), 14),
+            ("TEXTCOLOR", (0, 0), (-1, -1), TSI_BROWN),
+            ("TOPPADDING", (0, 0), (-1, -1), 12),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 10),
+        ]
+    )
+
+    def __init__(self, logo_path=None):
+        self.width, self.height = letter
+        self.styles = self._STYLES
+        self.logo_path = logo_path or "logo.png"
+        self._logo_image = load_logo(self.logo_path, 1.5 * inch, 0.8 * inch)
 
     def generate_report(self, timesheet_data, entry_data, save_backup=True):
         """Generate daily report PDF with markup"""
@@ -121,7 +255,7 @@ class TSIReportGenerator:
 
         # Materials section
         if entry_data.get("line_items"):
-            story.append(Paragraph("MATERIALS", self.styles["SectionHeader"]))
+            story.append(copy(self._MATERIALS_HEADING))
             materials_table, materials_subtotal = self._create_materials_table(
                 entry_data["line_items"]
             )
@@ -141,7 +275,7 @@ class TSIReportGenerator:
 
         # Equipment section
         if entry_data.get("equipment_rental_items"):
-            story.append(Paragraph("EQUIPMENT RENTALS", self.styles["SectionHeader"]))
+            story.append(copy(self._EQUIPMENT_HEADING))
             equipment_table, equipment_subtotal = self._create_equipment_table(
                 entry_data["equipment_rental_items"]
             )
@@ -161,7 +295,7 @@ class TSIReportGenerator:
 
         # Labor section (no markup)
         if entry_data.get("labor_entries"):
-            story.append(Paragraph("LABOR", self.styles["SectionHeader"]))
+            story.append(copy(self._LABOR_HEADING))
             labor_table = self._create_labor_table(entry_data["labor_entries"])
             story.append(labor_table)
             story.append(Spacer(1, 0.15 * inch))
@@ -265,66 +399,34 @@ class TSIReportGenerator:
         """Create separator line"""
         line_data = [["", ""]]
         line_table = Table(line_data, colWidths=[7 * inch])
-        line_table.setStyle(
-            TableStyle([("LINEBELOW", (0, 0), (-1, 0), 1.5, self.TSI_BROWN)])
-        )
+        line_table.setStyle(self._LINE_STYLE)
         return line_table
 
     def _create_header(self, data):
         """Create header with logo"""
         elements = []
 
-        logo_element = None
-        if os.path.exists(self.logo_path):
-            try:
-                logo = Image(
-                    self.logo_path,
-                    width=1.5 * inch,
-                    height=0.8 * inch,
-                    kind="proportional",
-                )
-                logo_element = logo
-            except:
-                pass
-
-        if logo_element:
+        if self._logo_image is not None:
             header_data = [
                 [
-                    logo_element,
+                    copy(self._logo_image),
                     Paragraph(data["company_name"], self.styles["CompanyName"]),
-                    Paragraph("DAILY REPORT", self.styles["ReportTitle"]),
+                    copy(self._REPORT_TITLE),
                 ]
             ]
             header_table = Table(
                 header_data, colWidths=[1.5 * inch, 3.25 * inch, 2.25 * inch]
             )
-            header_table.setStyle(
-                TableStyle(
-                    [
-                        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                        ("ALIGN", (0, 0), (0, 0), "LEFT"),
-                        ("ALIGN", (1, 0), (1, 0), "LEFT"),
-                        ("ALIGN", (2, 0), (2, 0), "RIGHT"),
-                    ]
-                )
-            )
+            header_table.setStyle(self._HEADER_STYLE_WITH_LOGO)
         else:
             header_data = [
                 [
                     Paragraph(data["company_name"], self.styles["CompanyName"]),
-                    Paragraph("DAILY REPORT", self.styles["ReportTitle"]),
+                    copy(self._REPORT_TITLE),
                 ]
             ]
             header_table = Table(header_data, colWidths=[4 * inch, 3 * inch])
-            header_table.setStyle(
-                TableStyle(
-                    [
-                        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                        ("ALIGN", (0, 0), (0, 0), "LEFT"),
-                        ("ALIGN", (1, 0), (1, 0), "RIGHT"),
-                    ]
-                )
-            )
+            header_table.setStyle(self._HEADER_STYLE_NO_LOGO)
 
         elements.append(header_table)
 
@@ -346,24 +448,21 @@ class TSIReportGenerator:
         elements = []
 
         try:
-            date_obj = datetime.strptime(data["entry_date"], "%Y-%m-%d")
+            date_obj = datetime.fromisoformat(data["entry_date"])
             formatted_date = date_obj.strftime("%A, %B %d, %Y")
         except:
             formatted_date = data["entry_date"]
 
+        # Labels and short values are plain strings styled by the TableStyle;
+        # only the job name can be long enough to need wrapping
         metadata_rows = [
-            [
-                Paragraph("<b>Job Number:</b>", self.styles["SmallText"]),
-                Paragraph(data["job_number"], self.styles["SmallText"]),
-                Paragraph("<b>Date:</b>", self.styles["SmallText"]),
-                Paragraph(formatted_date, self.styles["SmallText"]),
-            ],
+            ["Job Number:", data["job_number"], "Date:", formatted_date],
         ]
 
         if data.get("job_name"):
             metadata_rows.append(
                 [
-                    Paragraph("<b>Job Name:</b>", self.styles["SmallText"]),
+                    "Job Name:",
                     Paragraph(data["job_name"], self.styles["SmallText"]),
                     "",
                     "",
@@ -373,32 +472,16 @@ class TSIReportGenerator:
         metadata_table = Table(
             metadata_rows, colWidths=[1.2 * inch, 2.3 * inch, 0.8 * inch, 2.7 * inch]
         )
-        metadata_table.setStyle(
-            TableStyle(
-                [
-                    ("ALIGN", (0, 0), (0, -1), "LEFT"),
-                    ("ALIGN", (1, 0), (1, -1), "LEFT"),
-                    ("ALIGN", (2, 0), (2, -1), "LEFT"),
-                    ("ALIGN", (3, 0), (3, -1), "LEFT"),
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ]
-            )
-        )
+        metadata_table.setStyle(self._JOB_INFO_STYLE)
 
         elements.append(metadata_table)
         return elements
 
     def _create_materials_table(self, line_items):
         """Create materials table"""
-        table_data = [
-            [
-                Paragraph("<b>Material</b>", self.styles["TableText"]),
-                Paragraph("<b>Unit</b>", self.styles["TableText"]),
-                Paragraph("<b>Quantity</b>", self.styles["TableText"]),
-                Paragraph("<b>Price</b>", self.styles["TableText"]),
-                Paragraph("<b>Total</b>", self.styles["TableText"]),
-            ]
-        ]
+        # Only the name column wraps, so it is the only Paragraph; the other
+        # cells are plain strings styled by the TableStyle
+        table_data = [["Material", "Unit", "Quantity", "Price", "Total"]]
 
         materials_total = 0
         for item in line_items:
@@ -416,10 +499,10 @@ class TSIReportGenerator:
             table_data.append(
                 [
                     Paragraph(name, self.styles["TableText"]),
-                    Paragraph(item["unit"], self.styles["TableText"]),
-                    Paragraph(qty, self.styles["TableText"]),
-                    Paragraph(f"${item['unit_price']:.2f}", self.styles["TableText"]),
-                    Paragraph(f"${item['total_amount']:.2f}", self.styles["TableText"]),
+                    item["unit"],
+                    qty,
+                    f"${item['unit_price']:.2f}",
+                    f"${item['total_amount']:.2f}",
                 ]
             )
             materials_total += item["total_amount"]
@@ -427,11 +510,11 @@ class TSIReportGenerator:
         # Subtotal row
         table_data.append(
             [
-                Paragraph("<b>MATERIALS SUBTOTAL</b>", self.styles["TableText"]),
+                "MATERIALS SUBTOTAL",
                 "",
                 "",
                 "",
-                Paragraph(f"<b>${materials_total:,.2f}</b>", self.styles["TableText"]),
+                f"${materials_total:,.2f}",
             ]
         )
 
@@ -440,46 +523,15 @@ class TSIReportGenerator:
             colWidths=[2.8 * inch, 0.8 * inch, 1 * inch, 1 * inch, 1.4 * inch],
         )
 
-        table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), self.GRAY_LIGHT),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), self.TSI_DARK_BROWN),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, 0), 9),
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-                    ("TOPPADDING", (0, 0), (-1, 0), 8),
-                    ("FONTNAME", (0, 1), (-1, -2), "Helvetica"),
-                    ("FONTSIZE", (0, 1), (-1, -2), 9),
-                    ("TOPPADDING", (0, 1), (-1, -2), 6),
-                    ("BOTTOMPADDING", (0, 1), (-1, -2), 6),
-                    ("BACKGROUND", (0, -1), (-1, -1), self.GRAY_LIGHT),
-                    ("FONTNAME", (0, -1), (-1, -1), "Helvetica-Bold"),
-                    ("ALIGN", (0, 0), (0, -1), "LEFT"),
-                    ("ALIGN", (1, 0), (3, -1), "CENTER"),
-                    ("ALIGN", (4, 0), (4, -1), "RIGHT"),
-                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                    ("LINEBELOW", (0, 0), (-1, 0), 1, self.TSI_BROWN),
-                    ("LINEBELOW", (0, 1), (-1, -2), 0.5, colors.HexColor("#e5e7eb")),
-                    ("LINEABOVE", (0, -1), (-1, -1), 1, self.TSI_BROWN),
-                    ("BOX", (0, 0), (-1, -1), 1, self.TSI_BROWN),
-                ]
-            )
-        )
+        table.setStyle(self._ITEMS_STYLE)
 
         return table, materials_total
 
     def _create_equipment_table(self, equipment_items):
         """Create equipment table"""
-        table_data = [
-            [
-                Paragraph("<b>Equipment</b>", self.styles["TableText"]),
-                Paragraph("<b>Unit</b>", self.styles["TableText"]),
-                Paragraph("<b>Quantity</b>", self.styles["TableText"]),
-                Paragraph("<b>Rate</b>", self.styles["TableText"]),
-                Paragraph("<b>Total</b>", self.styles["TableText"]),
-            ]
-        ]
+        # Only the name column wraps, so it is the only Paragraph; the other
+        # cells are plain strings styled by the TableStyle
+        table_data = [["Equipment", "Unit", "Quantity", "Rate", "Total"]]
 
         equipment_total = 0
         for item in equipment_items:
@@ -497,10 +549,10 @@ class TSIReportGenerator:
             table_data.append(
                 [
                     Paragraph(name, self.styles["TableText"]),
-                    Paragraph(item["unit"], self.styles["TableText"]),
-                    Paragraph(qty, self.styles["TableText"]),
-                    Paragraph(f"${item['unit_rate']:.2f}", self.styles["TableText"]),
-                    Paragraph(f"${item['total_amount']:.2f}", self.styles["TableText"]),
+                    item["unit"],
+                    qty,
+                    f"${item['unit_rate']:.2f}",
+                    f"${item['total_amount']:.2f}",
                 ]
             )
             equipment_total += item["total_amount"]
@@ -508,11 +560,11 @@ class TSIReportGenerator:
         # Subtotal row
         table_data.append(
             [
-                Paragraph("<b>EQUIPMENT SUBTOTAL</b>", self.styles["TableText"]),
+                "EQUIPMENT SUBTOTAL",
                 "",
                 "",
                 "",
-                Paragraph(f"<b>${equipment_total:,.2f}</b>", self.styles["TableText"]),
+                f"${equipment_total:,.2f}",
             ]
         )
 
@@ -521,47 +573,15 @@ class TSIReportGenerator:
             colWidths=[2.8 * inch, 0.8 * inch, 1 * inch, 1 * inch, 1.4 * inch],
         )
 
-        table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), self.GRAY_LIGHT),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), self.TSI_DARK_BROWN),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, 0), 9),
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-                    ("TOPPADDING", (0, 0), (-1, 0), 8),
-                    ("FONTNAME", (0, 1), (-1, -2), "Helvetica"),
-                    ("FONTSIZE", (0, 1), (-1, -2), 9),
-                    ("TOPPADDING", (0, 1), (-1, -2), 6),
-                    ("BOTTOMPADDING", (0, 1), (-1, -2), 6),
-                    ("BACKGROUND", (0, -1), (-1, -1), self.GRAY_LIGHT),
-                    ("FONTNAME", (0, -1), (-1, -1), "Helvetica-Bold"),
-                    ("ALIGN", (0, 0), (0, -1), "LEFT"),
-                    ("ALIGN", (1, 0), (3, -1), "CENTER"),
-                    ("ALIGN", (4, 0), (4, -1), "RIGHT"),
-                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                    ("LINEBELOW", (0, 0), (-1, 0), 1, self.TSI_BROWN),
-                    ("LINEBELOW", (0, 1), (-1, -2), 0.5, colors.HexColor("#e5e7eb")),
-                    ("LINEABOVE", (0, -1), (-1, -1), 1, self.TSI_BROWN),
-                    ("BOX", (0, 0), (-1, -1), 1, self.TSI_BROWN),
-                ]
-            )
-        )
+        table.setStyle(self._ITEMS_STYLE)
 
         return table, equipment_total
 
     def _create_labor_table(self, labor_entries):
         """Create labor table"""
-        table_data = [
-            [
-                Paragraph("<b>Employee</b>", self.styles["TableText"]),
-                Paragraph("<b>Role</b>", self.styles["TableText"]),
-                Paragraph("<b>Reg Hrs</b>", self.styles["TableText"]),
-                Paragraph("<b>OT Hrs</b>", self.styles["TableText"]),
-                Paragraph("<b>Night</b>", self.styles["TableText"]),
-                Paragraph("<b>Total</b>", self.styles["TableText"]),
-            ]
-        ]
+        # Employee and role can wrap and stay Paragraphs; the other cells are
+        # plain strings styled by the TableStyle
+        table_data = [["Employee", "Role", "Reg Hrs", "OT Hrs", "Night", "Total"]]
 
         labor_total = 0
         for entry in labor_entries:
@@ -582,12 +602,10 @@ class TSIReportGenerator:
                 [
                     Paragraph(employee_name, self.styles["TableText"]),
                     Paragraph(entry["role_name"], self.styles["TableText"]),
-                    Paragraph(reg_hrs, self.styles["TableText"]),
-                    Paragraph(ot_hrs, self.styles["TableText"]),
-                    Paragraph(night_shift, self.styles["TableText"]),
-                    Paragraph(
-                        f"${entry['total_amount']:,.2f}", self.styles["TableText"]
-                    ),
+                    reg_hrs,
+                    ot_hrs,
+                    night_shift,
+                    f"${entry['total_amount']:,.2f}",
                 ]
             )
             labor_total += entry["total_amount"]
@@ -595,12 +613,12 @@ class TSIReportGenerator:
         # Subtotal row
         table_data.append(
             [
-                Paragraph("<b>LABOR TOTAL</b>", self.styles["TableText"]),
+                "LABOR TOTAL",
                 "",
                 "",
                 "",
                 "",
-                Paragraph(f"<b>${labor_total:,.2f}</b>", self.styles["TableText"]),
+                f"${labor_total:,.2f}",
             ]
         )
 
@@ -616,32 +634,7 @@ class TSIReportGenerator:
             ],
         )
 
-        table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), self.GRAY_LIGHT),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), self.TSI_DARK_BROWN),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, 0), 9),
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-                    ("TOPPADDING", (0, 0), (-1, 0), 8),
-                    ("FONTNAME", (0, 1), (-1, -2), "Helvetica"),
-                    ("FONTSIZE", (0, 1), (-1, -2), 9),
-                    ("TOPPADDING", (0, 1), (-1, -2), 6),
-                    ("BOTTOMPADDING", (0, 1), (-1, -2), 6),
-                    ("BACKGROUND", (0, -1), (-1, -1), self.GRAY_LIGHT),
-                    ("FONTNAME", (0, -1), (-1, -1), "Helvetica-Bold"),
-                    ("ALIGN", (0, 0), (1, -1), "LEFT"),
-                    ("ALIGN", (2, 0), (4, -1), "CENTER"),
-                    ("ALIGN", (5, 0), (5, -1), "RIGHT"),
-                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                    ("LINEBELOW", (0, 0), (-1, 0), 1, self.TSI_BROWN),
-                    ("LINEBELOW", (0, 1), (-1, -2), 0.5, colors.HexColor("#e5e7eb")),
-                    ("LINEABOVE", (0, -1), (-1, -1), 1, self.TSI_BROWN),
-                    ("BOX", (0, 0), (-1, -1), 1, self.TSI_BROWN),
-                ]
-            )
-        )
+        table.setStyle(self._LABOR_STYLE)
 
         return table
 
@@ -665,49 +658,15 @@ class TSIReportGenerator:
             )
 
         table = Table(data, colWidths=[5.8 * inch, 1.2 * inch])
-        table.setStyle(
-            TableStyle(
-                [
-                    ("ALIGN", (0, 0), (0, -1), "RIGHT"),
-                    ("ALIGN", (1, 0), (1, -1), "RIGHT"),
-                    (
-                        "FONTNAME",
-                        (0, -1),
-                        (-1, -1),
-                        "Helvetica-Bold",
-                    ),  # This makes the last row bold
-                    ("FONTSIZE", (0, 0), (-1, -1), 8),
-                    ("TOPPADDING", (0, 0), (-1, -1), 2),
-                    ("LINEABOVE", (0, -1), (-1, -1), 1, self.TSI_BROWN),
-                ]
-            )
-        )
+        table.setStyle(self._MARKUP_STYLE)
         return table
 
     def _create_total_section(self, grand_total):
         """Create grand total section"""
-        total_data = [
-            [
-                Paragraph("<b>GRAND TOTAL:</b>", self.styles["Normal"]),
-                Paragraph(f"<b>${grand_total:,.2f}</b>", self.styles["Normal"]),
-            ]
-        ]
+        total_data = [["GRAND TOTAL:", f"${grand_total:,.2f}"]]
 
         total_table = Table(total_data, colWidths=[5.6 * inch, 1.4 * inch])
-        total_table.setStyle(
-            TableStyle(
-                [
-                    ("ALIGN", (0, 0), (0, 0), "RIGHT"),
-                    ("ALIGN", (1, 0), (1, 0), "RIGHT"),
-                    ("FONTNAME", (0, 0), (-1, -1), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 14),
-                    ("TEXTCOLOR", (0, 0), (-1, -1), self.TSI_BROWN),
-                    ("TOPPADDING", (0, 0), (-1, -1), 12),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 10),
-                ]
-            )
-        )
+        total_table.setStyle(self._TOTAL_STYLE)
 
         return total_table
 